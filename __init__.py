@@ -5,12 +5,46 @@ A collection of simple utility nodes for ComfyUI including time-related,
 string manipulation, string file I/O, switch, script, and global nodes.
 """
 
+import functools
+import hashlib
+import json
+import mmap
 import os
+import random
+import re
+import socket
+import stat
 import threading
+import time
 import logging
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 logger = logging.getLogger()
 
+# Optional: BLAKE3 is preferred for backup integrity hashes when installed
+try:
+    import blake3
+    _BLAKE3_AVAILABLE = True
+except ImportError:
+    _BLAKE3_AVAILABLE = False
+
+# Optional: requests (pooled downloads).  Its HTTP / timeout errors are
+# handled like their urllib counterparts in _download_one.
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    _REQUESTS_AVAILABLE = True
+    _HTTP_ERRORS = (urllib.error.HTTPError, requests.HTTPError)
+    _TIMEOUT_ERRORS = (socket.timeout, requests.Timeout)
+except ImportError:
+    _REQUESTS_AVAILABLE = False
+    _HTTP_ERRORS = (urllib.error.HTTPError,)
+    _TIMEOUT_ERRORS = (socket.timeout,)
+
 from .autofix import apply_model_path_autofix
 
 # Apply global cross-platform model-path autofix as early as possible.
@@ -27,22 +61,30 @@ from .script_nodes import NODE_DISPLAY_NAME_MAPPINGS as SCRIPT_NODE_DISPLAY_NAME
 from .global_nodes import NODE_CLASS_MAPPINGS as GLOBAL_VAR_NODE_CLASS_MAPPINGS
 from .global_nodes import NODE_DISPLAY_NAME_MAPPINGS as GLOBAL_VAR_NODE_DISPLAY_NAME_MAPPINGS
 
-# Merge all node mappings
-NODE_CLASS_MAPPINGS = {
-    **TIME_NODE_CLASS_MAPPINGS,
-    **STRING_NODE_CLASS_MAPPINGS,
-    **SWITCH_NODE_CLASS_MAPPINGS,
-    **SCRIPT_NODE_CLASS_MAPPINGS,
-    **GLOBAL_VAR_NODE_CLASS_MAPPINGS,
-}
-
-NODE_DISPLAY_NAME_MAPPINGS = {
-    **TIME_NODE_DISPLAY_NAME_MAPPINGS,
-    **STRING_NODE_DISPLAY_NAME_MAPPINGS,
-    **SWITCH_NODE_DISPLAY_NAME_MAPPINGS,
-    **SCRIPT_NODE_DISPLAY_NAME_MAPPINGS,
-    **GLOBAL_VAR_NODE_DISPLAY_NAME_MAPPINGS,
-}
+# Merge all node mappings.  These stay plain dicts (not ChainMap views):
+# ComfyUI and tools such as ComfyUI-Manager expect real dict semantics.
+# Each merged dict is filled in place rather than via ``{**a, **b}``
+# unpacking, so no intermediate copies are built.
+NODE_CLASS_MAPPINGS = {}
+for _mappings in (
+    TIME_NODE_CLASS_MAPPINGS,
+    STRING_NODE_CLASS_MAPPINGS,
+    SWITCH_NODE_CLASS_MAPPINGS,
+    SCRIPT_NODE_CLASS_MAPPINGS,
+    GLOBAL_VAR_NODE_CLASS_MAPPINGS,
+):
+    NODE_CLASS_MAPPINGS.update(_mappings)
+
+NODE_DISPLAY_NAME_MAPPINGS = {}
+for _mappings in (
+    TIME_NODE_DISPLAY_NAME_MAPPINGS,
+    STRING_NODE_DISPLAY_NAME_MAPPINGS,
+    SWITCH_NODE_DISPLAY_NAME_MAPPINGS,
+    SCRIPT_NODE_DISPLAY_NAME_MAPPINGS,
+    GLOBAL_VAR_NODE_DISPLAY_NAME_MAPPINGS,
+):
+    NODE_DISPLAY_NAME_MAPPINGS.update(_mappings)
+del _mappings
 
 WEB_DIRECTORY = "./web"
 
@@ -60,46 +102,136 @@ _MANIFEST_PATH = os.path.join(_BACKUPS_DIR, ".manifest.json")
 
 _LOG_PREFIX = "[ComfyUI Simple Utility Nodes]"
 
+# Read size for chunked hashing / streamed downloads (fewer syscalls per file)
+_HASH_CHUNK = 1 << 20
+
+
+# Integrity hash for new manifest entries.  The hash only guards against
+# local corruption / partial writes (not tampering), so a fast non-SHA-2
+# hash is preferred: BLAKE3 when installed, otherwise BLAKE2b-256.
+_HASH_ALGO = "blake3" if _BLAKE3_AVAILABLE else "blake2b"
+
 
-def _sha256_of_bytes(data: bytes) -> str:
-    """Return the hex SHA-256 digest of *data*."""
-    import hashlib
-    return hashlib.sha256(data).hexdigest()
+def _new_hasher(algo: str):
+    """Return a fresh hash object for *algo* (sha256, blake2b or blake3)."""
+    if algo == "blake3" and _BLAKE3_AVAILABLE:
+        return blake3.blake3()
+    if algo == "blake2b":
+        return hashlib.blake2b(digest_size=32)
+    if algo == "sha256":
+        return hashlib.sha256()
+    raise ValueError(f"unsupported hash algorithm: {algo}")
 
 
-def _sha256_of_file(path: str) -> str | None:
-    """Return the hex SHA-256 digest of a file, or None on error."""
-    import hashlib
+def _hash_file(path: str, algo: str = _HASH_ALGO) -> str | None:
+    """Return the hex digest of a file using *algo*, or None on error."""
     try:
-        h = hashlib.sha256()
         with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(65536), b""):
+            # Python 3.11+: read/update loop runs entirely in C
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, lambda: _new_hasher(algo)).hexdigest()
+            h = _new_hasher(algo)
+            for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
                 h.update(chunk)
         return h.hexdigest()
-    except OSError:
+    except (OSError, ValueError):
         return None
 
 
+# Reserved manifest keys caching the last _scan_cdn_urls() result
+_SCAN_FINGERPRINT_KEY = "_scan_fingerprint"
+_SCAN_URLS_KEY = "_scan_urls"
+
+# Serialized form of what is currently on disk, so unchanged manifests
+# are never rewritten.
+_manifest_on_disk: str | None = None
+
+
+def _serialize_manifest(manifest: dict) -> str:
+    """Return the on-disk JSON text for *manifest*.
+
+    Compact separators and a single top-level sort keep the file small
+    and cheap to encode / parse.
+    """
+    return json.dumps(dict(sorted(manifest.items())), separators=(",", ":"))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_manifest_cached(mtime_ns: int, size: int) -> tuple[tuple, str]:
+    """Parse the manifest file once per ``(mtime, size)`` version.
+
+    Returns ``(sorted_items, serialized)``.  Callers build a fresh dict
+    from the items, so adding / replacing entries never touches the
+    cached copy.
+    """
+    with open(_MANIFEST_PATH, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    return tuple(sorted(manifest.items())), _serialize_manifest(manifest)
+
+
 def _load_manifest() -> dict:
-    """Load the backup manifest (filename → sha256 hex)."""
-    import json
+    """Load the backup manifest (filename →
+    ``{"algo": name, "hash": hex, "size": bytes}``).
+
+    Entries written by older versions are plain sha256 hex strings or
+    ``{"sha256": hex, "size": bytes}``; use :func:`_manifest_entry` to
+    read any form.  The reserved
+    ``_scan_fingerprint`` / ``_scan_urls`` keys cache the web/ URL scan.
+    """
+    global _manifest_on_disk
     try:
-        with open(_MANIFEST_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
+        st = os.stat(_MANIFEST_PATH)
+        items, _manifest_on_disk = _load_manifest_cached(st.st_mtime_ns, st.st_size)
     except (OSError, ValueError):
+        _manifest_on_disk = None
         return {}
+    return dict(items)
+
+
+def _manifest_entry(value) -> tuple[str, str | None, int | None]:
+    """Return ``(algo, hash, size)`` for a manifest value.
+
+    Legacy entries are sha256; plain string entries carry no size, so
+    ``size`` is None for them.
+    """
+    if isinstance(value, dict):
+        if "hash" in value:
+            return value.get("algo", "sha256"), value["hash"], value.get("size")
+        return "sha256", value.get("sha256"), value.get("size")
+    if isinstance(value, str):
+        return "sha256", value, None
+    return _HASH_ALGO, None, None
 
 
 def _save_manifest(manifest: dict) -> None:
-    """Persist the backup manifest to disk."""
-    import json
+    """Persist the backup manifest to disk.
+
+    The write goes to a temp file that is atomically renamed over the
+    manifest, so a crash mid-write can't leave a truncated file behind.
+    Skipped entirely when the content matches what is already on disk.
+    """
+    global _manifest_on_disk
+    payload = _serialize_manifest(manifest)
+    if payload == _manifest_on_disk:
+        return
+    tmp_path = _MANIFEST_PATH + ".tmp"
     try:
-        with open(_MANIFEST_PATH, "w", encoding="utf-8") as f:
-            json.dump(manifest, f, indent=2, sort_keys=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, _MANIFEST_PATH)
+        _manifest_on_disk = payload
     except OSError as exc:
         logger.warning("%s Failed to write manifest: %s", _LOG_PREFIX, exc)
 
 
+# Match common CDN URLs — jsdelivr, unpkg, cdnjs, skypack, esm.sh.
+# A bytes pattern, so its classes (e.g. \s) already have ASCII semantics:
+# no Unicode property lookups and no re.ASCII flag needed.
+_CDN_URL_RE = re.compile(
+    rb"""(https://(?:cdn\.jsdelivr\.net|unpkg\.com|cdnjs\.cloudflare\.com|cdn\.skypack\.dev|esm\.sh)/[^\s"'`<>]+)"""
+)
+
+
 def _scan_cdn_urls() -> dict[str, str]:
     """Scan all .js and .html files under web/ for CDN URLs.
 
@@ -108,54 +240,273 @@ def _scan_cdn_urls() -> dict[str, str]:
     ``{local_filename: cdn_url}``.  The local filename is derived from
     the last path component of the URL (e.g. ``katex.min.js``).
     """
-    import re
-    # Match common CDN URLs — jsdelivr, unpkg, cdnjs, skypack, esm.sh
-    url_re = re.compile(
-        r"""(https://(?:cdn\.jsdelivr\.net|unpkg\.com|cdnjs\.cloudflare\.com|cdn\.skypack\.dev|esm\.sh)/[^\s"'`<>]+)"""
-    )
     urls: dict[str, str] = {}
-    for fname in os.listdir(_WEB_DIR):
-        if not (fname.endswith(".js") or fname.endswith(".html")):
-            continue
-        fpath = os.path.join(_WEB_DIR, fname)
-        try:
-            with open(fpath, "r", encoding="utf-8") as f:
-                content = f.read()
-        except OSError:
-            continue
-        for match in url_re.finditer(content):
-            url = match.group(1)
-            # Derive local filename from the last path segment
-            local_name = url.rstrip("/").rsplit("/", 1)[-1]
-            if local_name:
-                urls[local_name] = url
+    with os.scandir(_WEB_DIR) as it:
+        for entry in it:
+            if not entry.name.endswith((".js", ".html")) or not entry.is_file():
+                continue
+            # Regex runs directly over a read-only mapping, so the file is
+            # never copied / decoded into a Python string.
+            try:
+                with open(entry.path, "rb") as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    matches = [m.group(1) for m in _CDN_URL_RE.finditer(mm)]
+            except (OSError, ValueError):   # ValueError: empty file
+                continue
+            for raw in matches:
+                url = raw.decode("utf-8", errors="replace")
+                # Derive local filename from the last path segment
+                local_name = url.rstrip("/").rsplit("/", 1)[-1]
+                if local_name:
+                    urls[local_name] = url
     return urls
 
 
+def _web_sources_fingerprint() -> str:
+    """Return a cheap fingerprint of the .js / .html files under web/.
+
+    Built from each file's name, size and mtime (stat only, no reads),
+    so it changes whenever a source file is added, removed or edited.
+    """
+    entries = []
+    with os.scandir(_WEB_DIR) as it:
+        for entry in it:
+            if entry.name.endswith((".js", ".html")) and entry.is_file():
+                st = entry.stat()
+                entries.append((entry.name, st.st_size, st.st_mtime_ns))
+    return hashlib.sha1(repr(sorted(entries)).encode("utf-8")).hexdigest()
+
+
+# Upper bound on concurrent CDN downloads (network-bound, so threads overlap
+# latency cleanly under the GIL)
+_DOWNLOAD_WORKERS = 8
+
+
+_USER_AGENT = "ComfyUI-Simple-Utility-Nodes/1.0"
+
+# Negative cache of unreachable CDN hosts: host → monotonic time of the
+# last exhausted retry budget.  Other files on that host are skipped for
+# _HOST_COOLDOWN_S seconds instead of each paying the full retry cost.
+_HOST_COOLDOWN_S = 60.0
+_host_cooldown: dict[str, float] = {}
+_host_cooldown_lock = threading.Lock()
+
+
+def _host_in_cooldown(host: str) -> bool:
+    """Return True if *host* exhausted its retries within the cooldown."""
+    with _host_cooldown_lock:
+        failed_at = _host_cooldown.get(host)
+    return failed_at is not None and time.monotonic() - failed_at < _HOST_COOLDOWN_S
+
+
+# Retries the pooled session's urllib3 Retry makes after the first try
+_SESSION_RETRIES = 2
+
+
+def _build_session():
+    """Return a ``requests.Session`` that reuses connections across files
+    and retries, or None when *requests* is not installed.
+
+    The session retries up to 3 attempts in total with exponential
+    back-off (also on 429/5xx).  Proxies are picked up the same way as
+    urllib's ``ProxyHandler`` (env-vars and, on Windows, the registry).
+    """
+    if not _REQUESTS_AVAILABLE:
+        return None
+
+    retry = Retry(
+        total=_SESSION_RETRIES,
+        backoff_factor=2,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    session = requests.Session()
+    session.headers["User-Agent"] = _USER_AGENT
+    session.mount(
+        "https://",
+        HTTPAdapter(max_retries=retry, pool_maxsize=_DOWNLOAD_WORKERS),
+    )
+    return session
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential back-off with jitter (≈2s, 4s, …, capped at 30s)."""
+    return min(30.0, 2 ** attempt + random.random())
+
+
+def _http_status(exc: Exception) -> int | None:
+    """Return the HTTP status carried by a urllib or requests HTTP error."""
+    code = getattr(exc, "code", None)
+    if code is None:
+        response = getattr(exc, "response", None)
+        code = getattr(response, "status_code", None)
+    return code
+
+
+def _attempts_made(session, attempt: int, exc: Exception | None) -> int:
+    """Return how many requests a failed download actually made.
+
+    On the session path the loop runs once, but urllib3's Retry has
+    already spent its whole budget on anything except a non-retried HTTP
+    status (e.g. 404), which surfaces as ``requests.HTTPError``.
+    """
+    if session is None or isinstance(exc, _HTTP_ERRORS):
+        return attempt
+    return _SESSION_RETRIES + 1
+
+
+def _download_one(filename: str, url: str, opener, reason: str,
+                  session=None) -> tuple[str, dict | None]:
+    """Download a single CDN resource into the backups directory.
+
+    Uses the pooled *session* when given (it retries internally),
+    otherwise the urllib *opener* with up to 3 attempts and jittered
+    back-off; 4xx responses and timeouts (urllib or requests) are not
+    retried, and a 4xx never puts the host in cooldown.  Hosts that
+    recently failed are skipped (see :func:`_host_in_cooldown`).  Returns ``(filename, manifest_entry)``
+    on success or ``(filename, None)`` on failure.
+    """
+    local_path = os.path.join(_BACKUPS_DIR, filename)
+    tmp_path = local_path + ".tmp"
+    host = urllib.parse.urlsplit(url).hostname or ""
+
+    # ── Download with retries ──
+    attempts = 1 if session is not None else 3
+    last_exc = None
+    for attempt in range(1, attempts + 1):
+        if _host_in_cooldown(host):
+            logger.warning(
+                "%s Skipping %s — CDN host %s failed recently.",
+                _LOG_PREFIX, filename, host,
+            )
+            return filename, None
+        try:
+            if session is not None:
+                resp = session.get(url, timeout=15, stream=True)
+                chunks = resp.iter_content(_HASH_CHUNK)
+            else:
+                req = urllib.request.Request(url)
+                req.add_header("User-Agent", _USER_AGENT)
+                resp = opener.open(req, timeout=15)
+                chunks = iter(lambda: resp.read(_HASH_CHUNK), b"")
+
+            # Hash while writing so the body is never held in memory whole
+            h = _new_hasher(_HASH_ALGO)
+            total = 0
+            with resp:
+                if session is not None:
+                    resp.raise_for_status()
+                # Stream into a sibling temp file and only move it over the
+                # backup once complete, so a failed download never leaves a
+                # truncated backup for the browser to be served.
+                try:
+                    with open(tmp_path, "wb") as f:
+                        for buf in chunks:
+                            h.update(buf)
+                            f.write(buf)
+                            total += len(buf)
+                    data_hash = h.hexdigest()
+                    os.replace(tmp_path, local_path)
+                except BaseException:
+                    try:
+                        os.remove(tmp_path)
+                    except OSError:
+                        pass
+                    raise
+
+            logger.info(
+                "%s Downloaded CDN backup: %s (%d bytes, %s=%s…) [%s]",
+                _LOG_PREFIX, filename, total, _HASH_ALGO, data_hash[:12], reason,
+            )
+            entry = {"algo": _HASH_ALGO, "hash": data_hash, "size": total}
+            return filename, entry
+
+        except _HTTP_ERRORS as exc:
+            last_exc = exc
+            code = _http_status(exc)
+            if code is not None and 400 <= code < 500 and code not in (408, 429):
+                break       # client error (e.g. 404) — retrying won't help
+            if attempt < attempts:
+                time.sleep(_retry_delay(attempt))
+                continue
+        except _TIMEOUT_ERRORS as exc:
+            # Stuck connection — already waited the full timeout once
+            last_exc = exc
+            with _host_cooldown_lock:
+                _host_cooldown[host] = time.monotonic()
+            break
+        # requests.RequestException derives from OSError
+        except (urllib.error.URLError, OSError, ValueError) as exc:
+            last_exc = exc
+            if attempt < attempts:
+                time.sleep(_retry_delay(attempt))
+                continue
+        except Exception as exc:
+            last_exc = exc
+            break           # unexpected error — don't retry
+    else:
+        # Every attempt failed — don't keep hammering this host
+        with _host_cooldown_lock:
+            _host_cooldown[host] = time.monotonic()
+        logger.warning(
+            "%s CDN unreachable for %s after %d attempt(s) — "
+            "backup not available. Markdown rendering may fail "
+            "if CDN is also unreachable from the browser. (%s)",
+            _LOG_PREFIX, filename, _attempts_made(session, attempt, last_exc),
+            last_exc,
+        )
+        return filename, None
+
+    logger.warning(
+        "%s Failed to download %s after %d attempt(s), not retrying: %s",
+        _LOG_PREFIX, filename, _attempts_made(session, attempt, last_exc),
+        last_exc,
+    )
+    return filename, None
+
+
 def _sync_cdn_backups() -> None:
-    """Check each discovered CDN resource against a local SHA-256 manifest
+    """Check each discovered CDN resource against a local hash manifest
     and download / re-download as needed.
 
     Integrity logic (per file):
       1. If the local file is missing or empty → download.
-      2. If the local file exists but its SHA-256 doesn't match the
+      2. If the local file size differs from the manifest → re-download
+         (no hashing needed).
+      3. If the local file exists but its hash doesn't match the
          manifest (corrupted / partial write) → re-download.
-      3. If the local file exists and its hash matches the manifest
+      4. If the local file exists and its hash matches the manifest
          → skip (fast, no network request).
 
-    After every successful download the manifest is updated on disk so
-    that subsequent runs can verify integrity purely locally.
+    Local hashing for step 3 runs concurrently in a thread pool.
+
+    Downloads run concurrently in a small thread pool; the manifest is
+    only touched from this thread as results are drained, and is saved
+    once at the end so that subsequent runs can verify integrity purely
+    locally.
 
     This runs in a daemon thread so it never blocks ComfyUI startup.
     """
-    import urllib.request
-    import urllib.error
-
     os.makedirs(_BACKUPS_DIR, exist_ok=True)
 
-    # Dynamically discover CDN URLs from our own JS/HTML source files
-    cdn_urls = _scan_cdn_urls()
+    manifest = _load_manifest()
+    manifest_dirty = False
+
+    # Dynamically discover CDN URLs from our own JS/HTML source files.
+    # The scan result is cached in the manifest and reused while the
+    # sources' fingerprint is unchanged.
+    fingerprint = _web_sources_fingerprint()
+    cached_urls = manifest.get(_SCAN_URLS_KEY)
+    if manifest.get(_SCAN_FINGERPRINT_KEY) == fingerprint and isinstance(cached_urls, dict):
+        cdn_urls = cached_urls
+    else:
+        cdn_urls = _scan_cdn_urls()
+        manifest[_SCAN_FINGERPRINT_KEY] = fingerprint
+        manifest[_SCAN_URLS_KEY] = cdn_urls
+        manifest_dirty = True
+
     if not cdn_urls:
+        if manifest_dirty:
+            _save_manifest(manifest)
         return
 
     logger.info(
@@ -163,9 +514,6 @@ def _sync_cdn_backups() -> None:
         _LOG_PREFIX, len(cdn_urls), ", ".join(sorted(cdn_urls.keys())),
     )
 
-    manifest = _load_manifest()
-    manifest_dirty = False
-
     # Build an opener that respects system proxy settings (e.g. Windows
     # Internet Options / registry proxy).  Plain urllib.request.urlopen
     # only checks HTTP_PROXY / HTTPS_PROXY env-vars which are often not
@@ -173,95 +521,98 @@ def _sync_cdn_backups() -> None:
     proxy_handler = urllib.request.ProxyHandler()   # auto-detects system proxy
     opener = urllib.request.build_opener(proxy_handler)
 
+    to_download: list[tuple[str, str, str]] = []
+    to_hash: list[tuple[str, str, str, int]] = []
+
+    # ── Fast local integrity check (one stat per file) ──
     for filename, url in cdn_urls.items():
         local_path = os.path.join(_BACKUPS_DIR, filename)
+        try:
+            st = os.stat(local_path)
+        except OSError:
+            st = None
 
-        # ── Fast local integrity check ──
-        need_download = False
-        reason = ""
-
-        if not os.path.isfile(local_path) or os.path.getsize(local_path) == 0:
-            need_download = True
-            reason = "missing or empty"
-        elif filename not in manifest:
-            # File exists but no manifest entry — first run after adding
-            # manifest support.  Hash the existing file and record it;
-            # no download needed unless the hash is suspiciously wrong
-            # (we trust it on first migration).
-            file_hash = _sha256_of_file(local_path)
-            if file_hash:
-                manifest[filename] = file_hash
-                manifest_dirty = True
-                logger.info(
-                    "%s Registered existing backup in manifest: %s (sha256=%s…)",
-                    _LOG_PREFIX, filename, file_hash[:12],
-                )
-            # Don't download — trust the existing file for migration
-        else:
-            # Both file and manifest entry exist — verify integrity
-            file_hash = _sha256_of_file(local_path)
-            if file_hash != manifest.get(filename):
-                need_download = True
-                reason = (
-                    f"integrity mismatch (expected {manifest[filename][:12]}…, "
-                    f"got {file_hash[:12] if file_hash else 'read-error'}…)"
-                )
-
-        if not need_download:
+        if st is None or not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            to_download.append((filename, url, "missing or empty"))
             continue
 
-        # ── Download with retries ──
-        last_exc = None
-        for attempt in range(1, 4):          # up to 3 attempts
-            try:
-                req = urllib.request.Request(url)
-                req.add_header("User-Agent", "ComfyUI-Simple-Utility-Nodes/1.0")
-                with opener.open(req, timeout=15) as resp:
-                    data = resp.read()
-
-                data_hash = _sha256_of_bytes(data)
-
-                with open(local_path, "wb") as f:
-                    f.write(data)
-
-                manifest[filename] = data_hash
-                manifest_dirty = True
-
-                logger.info(
-                    "%s Downloaded CDN backup: %s (%d bytes, sha256=%s…) [%s]",
-                    _LOG_PREFIX, filename, len(data), data_hash[:12], reason,
-                )
-                break   # success — move to next file
-
-            except (urllib.error.URLError, OSError, ValueError) as exc:
-                last_exc = exc
-                if attempt < 3:
-                    import time
-                    time.sleep(2 * attempt)     # back-off: 2s, 4s
-                    continue
-            except Exception as exc:
-                last_exc = exc
-                break           # unexpected error — don't retry
+        size = st.st_size
+        _, _, expected_size = _manifest_entry(manifest.get(filename))
+        if expected_size is not None and size != expected_size:
+            # Size alone proves a mismatch — no need to hash
+            to_download.append((filename, url, (
+                f"size mismatch (expected {expected_size} bytes, got {size})"
+            )))
         else:
-            # All 3 attempts failed
-            logger.warning(
-                "%s CDN unreachable for %s after 3 attempts — "
-                "backup not available. Markdown rendering may fail "
-                "if CDN is also unreachable from the browser. (%s)",
-                _LOG_PREFIX, filename, last_exc,
-            )
-            continue
-
-        if last_exc is not None and not os.path.isfile(local_path):
-            logger.warning(
-                "%s Unexpected error downloading %s: %s",
-                _LOG_PREFIX, filename, last_exc,
-            )
+            to_hash.append((filename, url, local_path, size))
+
+    # ── Hash the remaining candidates concurrently (hashlib releases the GIL) ──
+    if to_hash:
+        workers = min(_DOWNLOAD_WORKERS, len(to_hash))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            hashes = list(pool.map(
+                lambda item: _hash_file(item[2], _manifest_entry(manifest.get(item[0]))[0]),
+                to_hash,
+            ))
+
+        for (filename, url, local_path, size), file_hash in zip(to_hash, hashes):
+            if filename not in manifest:
+                # File exists but no manifest entry — first run after adding
+                # manifest support.  Record its hash; no download needed
+                # (we trust it on first migration).
+                if file_hash:
+                    manifest[filename] = {"algo": _HASH_ALGO, "hash": file_hash, "size": size}
+                    manifest_dirty = True
+                    logger.info(
+                        "%s Registered existing backup in manifest: %s (%s=%s…)",
+                        _LOG_PREFIX, filename, _HASH_ALGO, file_hash[:12],
+                    )
+                continue
+
+            algo, expected_hash, expected_size = _manifest_entry(manifest[filename])
+            if file_hash != expected_hash:
+                to_download.append((filename, url, (
+                    f"integrity mismatch (expected {(expected_hash or '')[:12]}…, "
+                    f"got {file_hash[:12] if file_hash else 'read-error'}…)"
+                )))
+            elif algo != _HASH_ALGO or expected_size is None:
+                # Legacy entry verified with its own algorithm — rewrite it
+                # with the current hash and size (one-time migration)
+                if algo != _HASH_ALGO:
+                    file_hash = _hash_file(local_path)
+                if file_hash:
+                    entry = dict(manifest[filename]) if isinstance(manifest[filename], dict) else {}
+                    entry.pop("sha256", None)
+                    entry.update(algo=_HASH_ALGO, hash=file_hash, size=size)
+                    manifest[filename] = entry
+                    manifest_dirty = True
+
+    if to_download:
+        # Prefer a pooled requests.Session so TCP/TLS connections are reused
+        # across files and retries; fall back to the urllib opener.
+        session = _build_session()
+        workers = min(_DOWNLOAD_WORKERS, len(to_download))
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_download_one, filename, url, opener, reason, session)
+                    for filename, url, reason in to_download
+                ]
+                for future in as_completed(futures):
+                    filename, entry = future.result()
+                    if entry:
+                        manifest[filename] = entry
+                        manifest_dirty = True
+        finally:
+            if session is not None:
+                session.close()
 
     # Persist manifest if anything changed
     if manifest_dirty:
         _save_manifest(manifest)
 
 
-# Run in a background daemon thread so startup isn't blocked
-threading.Thread(target=_sync_cdn_backups, daemon=True).start()
+# Run in a background daemon thread so startup isn't blocked.  Set
+# COMFY_SIMPLE_UTILS_SYNC_CDN=0 to skip the sync (no thread, no network).
+if os.environ.get("COMFY_SIMPLE_UTILS_SYNC_CDN", "1") == "1":
+    threading.Thread(target=_sync_cdn_backups, daemon=True).start()
@@ -17,18 +17,70 @@ Architecture:
   API to work even for the standalone viewer page.
 """
 
+import asyncio
 import atexit
+import copy
+import functools
+import hashlib
 import json
 import os
+import pickle
+import random
 import shutil
+import sys
 import threading
 import uuid
+from io import BytesIO
 from typing import Dict, List
 
+# Optional: libjpeg-turbo (PyTurboJPEG) for SIMD JPEG encoding of KSampler
+# step previews.  Falls back to PIL when the package or the shared library
+# is unavailable.  PyTurboJPEG encodes from numpy arrays, so it brings numpy.
+try:
+    import numpy as np
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJSAMP_420
+    _TJ = TurboJPEG()
+except Exception:
+    _TJ = None
+
+# Optional: OpenCV for the SIMD resize of step previews.  Falls back to
+# Pillow's resize.
+try:
+    import cv2
+    import numpy as np
+    _CV2_AVAILABLE = True
+except ImportError:
+    _CV2_AVAILABLE = False
+
+# Optional: xxhash for fingerprinting step previews (duplicate frames skip
+# the encode).  Falls back to an 8-byte BLAKE2b digest.
+try:
+    import xxhash
+    _XXHASH_AVAILABLE = True
+except ImportError:
+    _XXHASH_AVAILABLE = False
+
+# Optional: orjson for faster (de)serialization of the persisted prompt.
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
 # Path to persist the last user prompt across server restarts.
 _PERSIST_DIR = os.path.join(os.path.dirname(__file__), "..", ".cache")
 _PERSIST_PATH = os.path.normpath(os.path.join(_PERSIST_DIR, "last_prompt.json"))
 
+# Standalone viewer page, served from memory and re-read only when the
+# file changes on disk: ``(mtime_ns, size, bytes)``.
+_VIEWER_HTML_PATH = os.path.normpath(os.path.join(
+    os.path.dirname(__file__), "..", "web", "global_image_preview_viewer.html"
+))
+_viewer_html_cache: tuple | None = None
+_FAVICON_PATH = os.path.normpath(os.path.join(
+    os.path.dirname(__file__), "..", "web", "assets", "favicon.ico"
+))
+
 # ---------------------------------------------------------------------------
 # Server-side latest-image tracker
 # (Populated by hooking PromptServer.send_sync — see _install_server_hook)
@@ -38,15 +90,24 @@ _latest_images: List[Dict[str, str]] = []
 _latest_images_lock = threading.Lock()
 _latest_images_counter: int = 0  # bumped each time new executed images arrive
 _latest_images_signature: tuple | None = None
+# Immutable ``(images_tuple, counter)`` snapshot, republished by writers
+# under the lock.  Readers grab the single reference without locking —
+# rebinding a global is atomic, so they always see a consistent pair.
+_latest_images_snapshot: tuple = ((), 0)
 
 # Rolling history buffer — keeps the last N image batches so that the
 # standalone viewer never misses images between its 300 ms poll cycles.
-_image_history: List[tuple] = []  # [(counter, images_list), ...]
+_image_history: List[tuple] = []  # [(counter, images_tuple), ...]
 _IMAGE_HISTORY_MAX = 500
+# Bumped by clear_image_history() — the counters survive a clear, so the
+# HTTP ETags need this to tell the emptied buffers apart.
+_history_generation: int = 0
 
-_latest_preview_blob: bytes | None = None
 _latest_preview_lock = threading.Lock()
 _latest_preview_counter: int = 0  # bumped each time a new blob arrives
+# ``(blob, counter)`` — the only copy of the blob.  Single-assignment like
+# the images snapshot; the blob is immutable bytes, so readers never lock.
+_latest_preview_snapshot: tuple = (None, 0)
 
 _MEDIA_KIND_KEY = "_simple_media_kind"
 _MEDIA_KEY = "_simple_media_key"
@@ -285,7 +346,7 @@ def _set_latest_images(
     images: List[Dict[str, str]],
     signature: tuple | None = None,
 ) -> bool:
-    global _latest_images_counter, _latest_images_signature
+    global _latest_images_counter, _latest_images_signature, _latest_images_snapshot
     evicted_files: set[str] = set()
     with _latest_images_lock:
         if signature is not None and signature == _latest_images_signature:
@@ -294,7 +355,12 @@ def _set_latest_images(
         _latest_images.extend(images)
         _latest_images_counter += 1
         _latest_images_signature = signature
-        _image_history.append((_latest_images_counter, list(images)))
+        # One immutable batch backs both the lock-free snapshot and the
+        # history entry, so publishing costs a single copy.
+        batch = tuple(images)
+        _latest_images_snapshot = (batch, _latest_images_counter)
+        _image_history.append((_latest_images_counter, batch))
+        _notify_pollers_images_locked()
         if len(_image_history) > _IMAGE_HISTORY_MAX:
             evicted = _image_history[:len(_image_history) - _IMAGE_HISTORY_MAX]
             for _, evicted_images in evicted:
@@ -322,8 +388,8 @@ def _record_executed_media(
 
 
 def get_latest_images() -> tuple[List[Dict[str, str]], int]:
-    with _latest_images_lock:
-        return list(_latest_images), _latest_images_counter
+    images, counter = _latest_images_snapshot
+    return list(images), counter
 
 
 def get_images_since(since_counter: int) -> tuple[list, int]:
@@ -341,15 +407,18 @@ def clear_image_history() -> int:
 
     Returns the current counter value (so the viewer can fast-forward).
     """
-    global _latest_images_signature, _latest_preview_blob
+    global _latest_images_signature, _latest_images_snapshot
+    global _latest_preview_snapshot, _history_generation
     with _latest_images_lock:
         cache_files = _all_cached_files_locked()
+        _history_generation += 1
         _latest_images.clear()
         _image_history.clear()
         _latest_images_signature = None
         counter = _latest_images_counter
+        _latest_images_snapshot = ((), counter)
     with _latest_preview_lock:
-        _latest_preview_blob = None
+        _latest_preview_snapshot = (None, _latest_preview_counter)
     _delete_cache_files(cache_files)
     try:
         cache_dir = _cache_directory_path()
@@ -361,15 +430,229 @@ def clear_image_history() -> int:
 
 
 def _set_latest_preview_blob(blob: bytes) -> None:
-    global _latest_preview_blob, _latest_preview_counter
-    with _latest_preview_lock:
-        _latest_preview_blob = blob
+    global _latest_preview_counter, _latest_preview_snapshot
+    with _latest_preview_lock:   # serializes writers only
         _latest_preview_counter += 1
+        _latest_preview_snapshot = (blob, _latest_preview_counter)
+        _notify_pollers()
 
 
 def get_latest_preview_blob() -> tuple[bytes | None, int]:
-    with _latest_preview_lock:
-        return _latest_preview_blob, _latest_preview_counter
+    return _latest_preview_snapshot
+
+
+# Long-poll support: an asyncio.Condition owned by the server loop, notified
+# whenever the image/preview counters or the workflow status move.  Writers
+# run on executor/worker threads, so they only hop onto the loop.
+_poll_cond: asyncio.Condition | None = None
+_poll_loop: asyncio.AbstractEventLoop | None = None
+_poll_wake_pending = False  # coalesces wakes (touched on the loop only)
+# Strong refs to in-flight notify tasks: the loop itself only keeps weak
+# references, so an unreferenced task can be collected before it runs.
+_poll_notify_tasks: set[asyncio.Task] = set()
+
+
+def _notify_pollers() -> None:
+    """Wake any pending long-poll requests.  Safe to call from any thread."""
+    loop = _poll_loop
+    if loop is None:
+        return
+    try:
+        loop.call_soon_threadsafe(_wake_pollers)
+    except RuntimeError:
+        pass  # loop closed
+
+
+def _wake_pollers() -> None:
+    global _poll_wake_pending
+    if _poll_wake_pending:
+        return
+    _poll_wake_pending = True
+
+    async def _notify():
+        global _poll_wake_pending
+        async with _poll_cond:
+            # Cleared under the lock: anything after this schedules a new wake
+            _poll_wake_pending = False
+            _poll_cond.notify_all()
+
+    task = _poll_loop.create_task(_notify())
+    _poll_notify_tasks.add(task)
+    task.add_done_callback(_poll_notify_tasks.discard)
+
+
+# Several output nodes usually finish within a few ms of each other; their
+# batches are published at once but pollers are woken once per window.
+_IMAGES_NOTIFY_DELAY_S = 0.03
+# Set by writers (under _latest_images_lock, which serialises them) and
+# cleared on the loop with a plain store — the loop never takes that lock.
+# A writer that still sees the flag set published before the clear, so the
+# pending flush's wake covers its batch.
+_images_notify_armed = False
+
+
+def _notify_pollers_images_locked() -> None:
+    """Schedule a coalesced wake for new image batches (lock held)."""
+    global _images_notify_armed
+    loop = _poll_loop
+    if loop is None or _images_notify_armed:
+        return
+    _images_notify_armed = True
+    try:
+        loop.call_soon_threadsafe(loop.call_later, _IMAGES_NOTIFY_DELAY_S, _flush_images_notify)
+    except RuntimeError:
+        _images_notify_armed = False  # loop closed
+
+
+def _flush_images_notify() -> None:
+    global _images_notify_armed
+    _images_notify_armed = False
+    _wake_pollers()
+
+
+def _get_poll_condition() -> asyncio.Condition:
+    """Return the long-poll condition, creating it on the running loop."""
+    global _poll_cond, _poll_loop
+    if _poll_cond is None:
+        _poll_cond = asyncio.Condition()
+        _poll_loop = asyncio.get_running_loop()
+    return _poll_cond
+
+
+def _preview_fingerprint(raw) -> int | bytes:
+    """Hash a bytes-like / C-contiguous buffer of preview pixels."""
+    if _XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_intdigest(raw)
+    return hashlib.blake2b(raw, digest_size=8).digest()
+
+
+def _contain_size(size: tuple[int, int], max_size: int) -> tuple[int, int]:
+    """Target size of ``ImageOps.contain(img, (max_size, max_size))``."""
+    width, height = size
+    if width == height:
+        return max_size, max_size
+    if width > height:
+        return max_size, max(1, round(height / width * max_size))
+    return max(1, round(width / height * max_size)), max_size
+
+
+def _resize_preview_array(arr, max_size: int):
+    """OpenCV counterpart of ``_resize_preview`` for an HxWxC uint8 array."""
+    height, width = arr.shape[:2]
+    target = _contain_size((width, height), max_size)
+    if target == (width, height):
+        return arr
+    # INTER_AREA when shrinking approximates Pillow's antialiased
+    # bilinear; plain INTER_LINEAR would alias on large reductions.
+    shrinking = target[0] < width
+    return cv2.resize(
+        arr, target,
+        interpolation=cv2.INTER_AREA if shrinking else cv2.INTER_LINEAR,
+    )
+
+
+def _resize_preview(img, max_size: int):
+    """Fit *img* into a ``max_size`` square (same geometry as ImageOps.contain)."""
+    from PIL import Image
+    target = _contain_size(img.size, max_size)
+    if target == img.size:
+        return img
+    if _CV2_AVAILABLE and img.mode == "RGB":
+        return Image.fromarray(_resize_preview_array(np.asarray(img), max_size))
+    resampling = getattr(Image, "Resampling", Image).BILINEAR
+    return img.resize(target, resampling)
+
+
+# Fingerprint of the last encoded preview; only touched by the preview worker.
+_last_preview_key: tuple | None = None
+# Pillow encode target, also owned by the preview worker.  Rewound rather
+# than truncated between frames (truncate(0) would shrink the allocation),
+# so steady-state frames are written without regrowing the buffer.
+_preview_buf = BytesIO()
+
+
+def _encode_and_store_preview(image_data):
+    """Encode a (format_str, PIL.Image, max_size) tuple to JPEG bytes and store it."""
+    global _last_preview_key
+    fmt = image_data[0]   # "JPEG" or "PNG"
+    img = image_data[1]
+    max_size = image_data[2]
+    use_tj = _TJ is not None and fmt == "JPEG"
+    # Paused / converged samplers resend identical frames.  Fingerprint the
+    # frame as received so a repeat skips the resize as well as the encode
+    # (and the counter bump) unless the blob was cleared in the meantime.
+    if use_tj and _CV2_AVAILABLE:
+        # Resize and encode straight from the pixel array, skipping the
+        # PIL wrap/unwrap (two full-frame copies) between the two steps.
+        pixels = np.asarray(img if img.mode == "RGB" else img.convert("RGB"))
+        key = (fmt, max_size, pixels.shape, _preview_fingerprint(pixels))
+    else:
+        pixels = None
+        key = (fmt, max_size, img.mode, img.size, _preview_fingerprint(img.tobytes()))
+    if key == _last_preview_key and _latest_preview_snapshot[0] is not None:
+        return
+    if max_size is not None:
+        if pixels is not None:
+            pixels = _resize_preview_array(pixels, max_size)
+        else:
+            img = _resize_preview(img, max_size)
+    if use_tj:
+        if pixels is None:
+            pixels = np.asarray(img if img.mode == "RGB" else img.convert("RGB"))
+        _set_latest_preview_blob(_TJ.encode(
+            pixels, quality=95, pixel_format=TJPF_RGB, jpeg_subsample=TJSAMP_420,
+        ))
+    else:
+        buf = _preview_buf
+        buf.seek(0)
+        img.save(buf, format=fmt, quality=95, compress_level=1)
+        with buf.getbuffer() as view:
+            _set_latest_preview_blob(bytes(view[:buf.tell()]))
+    _last_preview_key = key
+
+
+# Step previews are encoded on a single worker thread.  The hook only drops
+# the raw image into a one-slot, last-writer-wins mailbox, so frames the
+# worker never got to are discarded without any encode work.
+_pending_preview: tuple | None = None
+_pending_preview_cv = threading.Condition()
+_preview_worker_started = False
+
+
+def _queue_preview(image_data) -> None:
+    """Hand a ``(format_str, PIL.Image, max_size)`` tuple to the worker."""
+    global _pending_preview
+    with _pending_preview_cv:
+        was_empty = _pending_preview is None
+        _pending_preview = image_data
+        # A full slot means the worker has yet to take the previous frame
+        # and will pick this one up instead — no wake-up needed.
+        if was_empty:
+            _pending_preview_cv.notify()
+
+
+def _preview_worker() -> None:
+    global _pending_preview
+    while True:
+        with _pending_preview_cv:
+            while _pending_preview is None:
+                _pending_preview_cv.wait()
+            image_data = _pending_preview
+            _pending_preview = None
+        try:
+            _encode_and_store_preview(image_data)
+        except Exception:
+            pass
+
+
+def _start_preview_worker() -> None:
+    global _preview_worker_started
+    if _preview_worker_started:
+        return
+    _preview_worker_started = True
+    threading.Thread(
+        target=_preview_worker, name="GlobalImagePreviewEncoder", daemon=True,
+    ).start()
 
 
 # ---------------------------------------------------------------------------
@@ -383,17 +666,35 @@ _current_node_class: str | None = None
 _current_prompt_id: str | None = None
 _user_prompt: dict | None = None       # original user prompt, NEVER overwritten by reruns
 _user_extra_data: dict | None = None
+# ``_freeze_json([_user_prompt, _user_extra_data or {}])`` for the current
+# pair, built lazily by the first rerun and reused until the prompt changes.
+_user_prompt_frozen: bytes | None = None
 
 # Guard: True while any rerun (same or new) is in-flight so that
 # _patched_put does not overwrite _user_prompt with rerun data.
 _rerun_in_progress: bool = False
 
+# Set while no workflow is running; lets route handlers await the stop
+# instead of polling.  Bound to the server loop on first use.
+_workflow_stopped_event: asyncio.Event | None = None
+_workflow_stopped_loop: asyncio.AbstractEventLoop | None = None
+
+# Bumped (under the lock) whenever get_workflow_status() would change, so
+# long-poll clients can wait on it alongside the image/preview counters.
+_workflow_status_counter: int = 0
+
 # Tracks the last successfully queued rerun_id for per-tab confirmation.
 _last_rerun_id: str | None = None
 
 # Tracks the last successfully processed interrupt_id for per-tab confirmation.
 _last_interrupt_id: str | None = None
 
+# Immutable copy of the fields above, republished by every status bump so
+# get_workflow_status() can read it without the lock:
+# (running, node_id, node_class, prompt_id, has_last_prompt,
+#  last_rerun_id, last_interrupt_id, status_counter)
+_workflow_status_snapshot: tuple = (False, None, None, None, False, None, None, 0)
+
 
 def _set_workflow_executing(node_id: str | None, prompt_id: str | None,
                             node_class: str | None = None) -> None:
@@ -410,24 +711,186 @@ def _set_workflow_executing(node_id: str | None, prompt_id: str | None,
             _current_prompt_id = prompt_id
             if node_class:
                 _current_node_class = node_class
+        # Mirror the state onto the asyncio event (we may be on the
+        # prompt-worker thread, so hop onto the server loop).
+        if _workflow_stopped_event is not None:
+            update = _workflow_stopped_event.clear if _workflow_running else _workflow_stopped_event.set
+            try:
+                _workflow_stopped_loop.call_soon_threadsafe(update)
+            except RuntimeError:
+                pass  # loop closed
+        _bump_workflow_status_locked()
+
+
+def _bump_workflow_status_locked() -> None:
+    """Record a status change; the caller holds ``_workflow_status_lock``."""
+    global _workflow_status_counter, _workflow_status_snapshot
+    _workflow_status_counter += 1
+    _workflow_status_snapshot = (
+        _workflow_running, _current_node_id, _current_node_class,
+        _current_prompt_id, _user_prompt is not None, _last_rerun_id,
+        _last_interrupt_id, _workflow_status_counter,
+    )
+    _notify_pollers()
+
+
+def _get_workflow_stopped_event() -> asyncio.Event:
+    """Return the event that is set whenever no workflow is running.
+
+    Created lazily on the server's running loop (must be called from a
+    coroutine); :func:`_set_workflow_executing` keeps it in sync.
+    """
+    global _workflow_stopped_event, _workflow_stopped_loop
+    with _workflow_status_lock:
+        if _workflow_stopped_event is None:
+            event = asyncio.Event()
+            if not _workflow_running:
+                event.set()
+            _workflow_stopped_loop = asyncio.get_running_loop()
+            _workflow_stopped_event = event
+        return _workflow_stopped_event
+
+
+async def _wait_for_workflow_stop(timeout: float = 5.0) -> None:
+    """Wait (up to *timeout* seconds) until the running workflow stops."""
+    event = _get_workflow_stopped_event()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while _workflow_running:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return
+        # The event may still be set from before the workflow started (its
+        # clear() is queued behind us); any later stop sets it again.
+        event.clear()
+        try:
+            await asyncio.wait_for(event.wait(), timeout=remaining)
+        except asyncio.TimeoutError:
+            return
 
 
-def _set_user_prompt(prompt: dict, extra_data: dict | None = None) -> None:
-    global _user_prompt, _user_extra_data
+def _set_user_prompt(prompt: dict, extra_data: dict | None = None,
+                     frozen: bytes | None = None) -> None:
+    global _user_prompt, _user_extra_data, _user_prompt_frozen
     with _workflow_status_lock:
+        had_prompt = _user_prompt is not None
         _user_prompt = prompt
         _user_extra_data = extra_data
-    # Persist to disk so it survives server restarts
-    _save_user_prompt_to_disk(prompt, extra_data)
+        _user_prompt_frozen = frozen
+        if not had_prompt:
+            _bump_workflow_status_locked()  # has_last_prompt flips
+    # Persist to disk so it survives server restarts (off the queue path)
+    _queue_persist(prompt, extra_data)
+
+
+# Prompt persistence runs on a background writer with a one-slot,
+# last-writer-wins mailbox (same pattern as the preview encoder), so rapid
+# queue submissions collapse into a single disk write.
+_pending_persist: tuple | None = None
+_pending_persist_cv = threading.Condition()
+_persist_worker_started = False
+
+
+def _queue_persist(prompt: dict, extra_data: dict | None) -> None:
+    global _pending_persist, _persist_worker_started
+    with _pending_persist_cv:
+        _pending_persist = (prompt, extra_data)
+        _pending_persist_cv.notify()
+        if not _persist_worker_started:
+            _persist_worker_started = True
+            threading.Thread(
+                target=_persist_worker, name="GlobalImagePreviewPersist", daemon=True,
+            ).start()
+
+
+def _persist_worker() -> None:
+    global _pending_persist
+    while True:
+        with _pending_persist_cv:
+            while _pending_persist is None:
+                _pending_persist_cv.wait()
+            prompt, extra_data = _pending_persist
+            _pending_persist = None
+        _save_user_prompt_to_disk(prompt, extra_data)
+
+
+def _dump_json_bytes(payload) -> bytes:
+    """Serialize *payload* to UTF-8 JSON bytes in one shot."""
+    if _ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints beyond 64 bits — let stdlib json handle it
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _load_json_bytes(data: bytes):
+    """Parse UTF-8 JSON *data* (counterpart of :func:`_dump_json_bytes`)."""
+    if _ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # let stdlib json produce the error (or accept the input)
+    return json.loads(data)
+
+
+def _freeze_json(obj) -> bytes | None:
+    """Serialize a JSON-shaped prompt structure into an immutable snapshot.
+
+    Returns ``None`` for anything the encoder rejects (arbitrary objects;
+    with orjson also non-str keys and ints beyond 64 bits) so callers can
+    fall back to :func:`_clone_unfreezable`.
+    """
+    try:
+        if _ORJSON_AVAILABLE:
+            return orjson.dumps(obj)
+        return json.dumps(obj).encode("utf-8")
+    except (TypeError, ValueError):  # orjson.JSONEncodeError is a TypeError
+        return None
+
+
+def _thaw_json(data: bytes):
+    """Build a fresh, unaliased object tree from a ``_freeze_json`` snapshot."""
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _clone_unfreezable(obj):
+    """Deep-copy a prompt structure that :func:`_freeze_json` rejected.
+
+    A pickle round trip still copies in C; ``copy.deepcopy`` is only the
+    last resort for objects pickle cannot handle either.
+    """
+    try:
+        return pickle.loads(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return copy.deepcopy(obj)
 
 
 def _save_user_prompt_to_disk(prompt: dict, extra_data: dict | None) -> None:
-    """Write the last user prompt to a JSON file for cross-session rerun."""
+    """Write the last user prompt to a JSON file for cross-session rerun.
+
+    The payload is serialized once and written with a single ``os.write``
+    (looped only for short writes) to a temp file that is then atomically
+    renamed into place.  No fsync: this is a best-effort cache, and a
+    truncated file after a power loss just fails to load (see
+    :func:`_load_user_prompt_from_disk`), so the prompt is re-captured on
+    the next queue.
+    """
     try:
         os.makedirs(_PERSIST_DIR, exist_ok=True)
         payload = {"prompt": prompt, "extra_data": extra_data or {}}
-        with open(_PERSIST_PATH, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False)
+        data = memoryview(_dump_json_bytes(payload))
+        tmp_path = _PERSIST_PATH + ".tmp"
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(tmp_path, flags, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, _PERSIST_PATH)
     except Exception:
         pass  # best-effort
 
@@ -437,8 +900,7 @@ def _load_user_prompt_from_disk() -> bool:
 
     Returns True if successful, False otherwise.
     """
-    global _user_prompt, _user_extra_data
-    import copy
+    global _user_prompt, _user_extra_data, _user_prompt_frozen
     with _workflow_status_lock:
         if _user_prompt is not None:
             return True  # already have one
@@ -446,33 +908,40 @@ def _load_user_prompt_from_disk() -> bool:
     try:
         if not os.path.isfile(_PERSIST_PATH):
             return False
-        with open(_PERSIST_PATH, "r", encoding="utf-8") as f:
-            payload = json.load(f)
+        with open(_PERSIST_PATH, "rb") as f:
+            payload = _load_json_bytes(f.read())
         prompt = payload.get("prompt")
         extra_data = payload.get("extra_data", {})
         if not prompt or not isinstance(prompt, dict):
             return False
         # Write directly to globals (skip _set_user_prompt to avoid
-        # redundantly re-saving the same file we just loaded).
+        # redundantly re-saving the same file we just loaded).  The parsed
+        # objects are freshly built and unaliased, so no copy is needed.
         with _workflow_status_lock:
-            _user_prompt = copy.deepcopy(prompt)
-            _user_extra_data = copy.deepcopy(extra_data)
+            had_prompt = _user_prompt is not None
+            _user_prompt = prompt
+            _user_extra_data = extra_data
+            _user_prompt_frozen = None
+            if not had_prompt:
+                _bump_workflow_status_locked()
         return True
     except Exception:
         return False
 
 
 def get_workflow_status() -> dict:
-    with _workflow_status_lock:
-        return {
-            "running": _workflow_running,
-            "current_node_id": _current_node_id,
-            "current_node_class": _current_node_class,
-            "prompt_id": _current_prompt_id,
-            "has_last_prompt": _user_prompt is not None,
-            "last_rerun_id": _last_rerun_id,
-            "last_interrupt_id": _last_interrupt_id,
-        }
+    (running, node_id, node_class, prompt_id, has_last_prompt,
+     last_rerun_id, last_interrupt_id, counter) = _workflow_status_snapshot
+    return {
+        "running": running,
+        "current_node_id": node_id,
+        "current_node_class": node_class,
+        "prompt_id": prompt_id,
+        "has_last_prompt": has_last_prompt,
+        "last_rerun_id": last_rerun_id,
+        "last_interrupt_id": last_interrupt_id,
+        "status_counter": counter,
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -492,7 +961,6 @@ def _install_server_hook() -> None:
     global _hook_installed
     if _hook_installed:
         return
-    _hook_installed = True
 
     try:
         from server import PromptServer, BinaryEventTypes
@@ -500,83 +968,89 @@ def _install_server_hook() -> None:
         return
     if not hasattr(PromptServer, "instance") or PromptServer.instance is None:
         return
+    # Sticky only once the server exists, so execute() can retry an
+    # attempt made before it was up.
+    _hook_installed = True
 
     server = PromptServer.instance
     _orig_send_sync = server.send_sync
 
-    def _patched_send_sync(event, data, sid=None):
-        try:
-            # Capture "executed" events that contain images
-            if event == "executed" and isinstance(data, dict):
-                output = data.get("output")
-                if output and isinstance(output, dict):
-                    _record_executed_media(
-                        output,
-                        data.get("node"),
-                        data.get("display_node"),
-                        data.get("prompt_id"),
-                    )
+    def _on_executed(data) -> None:
+        # Capture "executed" events that contain images
+        if not isinstance(data, dict):
+            return
+        output = data.get("output")
+        if output and isinstance(output, dict):
+            _record_executed_media(
+                output,
+                data.get("node"),
+                data.get("display_node"),
+                data.get("prompt_id"),
+            )
 
-            # Track which node is currently executing
-            if event == "executing" and isinstance(data, dict):
-                node_id = data.get("node")
-                prompt_id = data.get("prompt_id")
-                display_node = data.get("display_node")
-                # Try to resolve the node class type from the prompt
-                node_class = None
-                if node_id is not None:
-                    try:
-                        status = get_workflow_status()
-                        pid = prompt_id or status.get("prompt_id")
-                        if pid and _user_prompt:
-                            node_info = _user_prompt.get(node_id) or _user_prompt.get(display_node)
-                            if node_info and isinstance(node_info, dict):
-                                node_class = node_info.get("class_type")
-                    except Exception:
-                        pass
-                _set_workflow_executing(node_id, prompt_id, node_class)
-
-            # Capture the prompt data when execution_start fires for requeue
-            if event == "execution_start" and isinstance(data, dict):
-                prompt_id = data.get("prompt_id")
-                if prompt_id:
-                    _set_workflow_executing("__starting__", prompt_id, "Starting…")
-
-            # Capture unencoded preview images (KSampler step previews)
-            # Old method: UNENCODED_PREVIEW_IMAGE — data is (format_str, PIL.Image, max_size)
-            if event == BinaryEventTypes.UNENCODED_PREVIEW_IMAGE and data is not None:
-                try:
-                    _encode_and_store_preview(data)
-                except Exception:
-                    pass
+    def _on_executing(data) -> None:
+        # Track which node is currently executing
+        if not isinstance(data, dict):
+            return
+        node_id = data.get("node")
+        prompt_id = data.get("prompt_id")
+        display_node = data.get("display_node")
+        # Try to resolve the node class type from the prompt
+        node_class = None
+        if node_id is not None:
+            try:
+                pid = prompt_id or _current_prompt_id  # plain global read
+                if pid and _user_prompt:
+                    node_info = _user_prompt.get(node_id) or _user_prompt.get(display_node)
+                    if node_info and isinstance(node_info, dict):
+                        node_class = node_info.get("class_type")
+            except Exception:
+                pass
+        _set_workflow_executing(node_id, prompt_id, node_class)
+
+    def _on_execution_start(data) -> None:
+        # Capture the prompt data when execution_start fires for requeue
+        if isinstance(data, dict):
+            prompt_id = data.get("prompt_id")
+            if prompt_id:
+                _set_workflow_executing("__starting__", prompt_id, "Starting…")
+
+    def _on_unencoded_preview(data) -> None:
+        # Capture unencoded preview images (KSampler step previews)
+        # Old method: UNENCODED_PREVIEW_IMAGE — data is (format_str, PIL.Image, max_size)
+        if data is not None:
+            _queue_preview(data)
+
+    def _on_preview_with_metadata(data) -> None:
+        # New method: PREVIEW_IMAGE_WITH_METADATA — data is ((format_str, PIL.Image, max_size), metadata_dict)
+        # Modern frontends that declare "supports_preview_metadata" use this path instead.
+        if data is not None:
+            _queue_preview(data[0])
+
+    # send_sync fires for every progress / status / preview event; the
+    # uninteresting majority cost a single dict miss.
+    handlers = {
+        "executed": _on_executed,
+        "executing": _on_executing,
+        "execution_start": _on_execution_start,
+        BinaryEventTypes.UNENCODED_PREVIEW_IMAGE: _on_unencoded_preview,
+    }
+    # The metadata variant only exists on newer ComfyUI builds.
+    preview_meta = getattr(BinaryEventTypes, "PREVIEW_IMAGE_WITH_METADATA", None)
+    if preview_meta is not None:
+        handlers[preview_meta] = _on_preview_with_metadata
 
-            # New method: PREVIEW_IMAGE_WITH_METADATA — data is ((format_str, PIL.Image, max_size), metadata_dict)
-            # Modern frontends that declare "supports_preview_metadata" use this path instead.
-            if event == BinaryEventTypes.PREVIEW_IMAGE_WITH_METADATA and data is not None:
-                try:
-                    image_tuple = data[0]  # (format_str, PIL.Image, max_size)
-                    _encode_and_store_preview(image_tuple)
-                except Exception:
-                    pass
+    def _patched_send_sync(event, data, sid=None):
+        try:
+            handler = handlers.get(event)
+            if handler is not None:
+                handler(data)
         except Exception:
             pass
 
         return _orig_send_sync(event, data, sid)
 
-    def _encode_and_store_preview(image_data):
-        """Encode a (format_str, PIL.Image, max_size) tuple to JPEG bytes and store it."""
-        from io import BytesIO
-        from PIL import Image, ImageOps
-        fmt = image_data[0]   # "JPEG" or "PNG"
-        img = image_data[1]
-        max_size = image_data[2]
-        if max_size is not None:
-            resampling = getattr(Image, "Resampling", Image).BILINEAR
-            img = ImageOps.contain(img, (max_size, max_size), resampling)
-        buf = BytesIO()
-        img.save(buf, format=fmt, quality=95, compress_level=1)
-        _set_latest_preview_blob(buf.getvalue())
-
+    _start_preview_worker()
     server.send_sync = _patched_send_sync
 
     # Also hook prompt_queue.put to capture prompt data for rerun.
@@ -586,8 +1060,10 @@ def _install_server_hook() -> None:
     def _patched_put(item):
         try:
             if item and len(item) >= 4 and not _rerun_in_progress:
-                import copy
-                _set_user_prompt(copy.deepcopy(item[2]), copy.deepcopy(item[3]))
+                # Store references only — no copy on the queue hot path.
+                # ComfyUI doesn't mutate the queued prompt / extra_data
+                # in place, and every reader (rerun) deep-copies first.
+                _set_user_prompt(item[2], item[3])
         except Exception:
             pass
         return _orig_put(item)
@@ -601,18 +1077,50 @@ def _install_server_hook() -> None:
 # Prompt input keys that typically carry a seed value.
 _SEED_INPUT_KEYS = {"seed", "noise_seed", "seed_num"}
 
+# Seed values arrive from JSON, so they are exactly int or float; an exact
+# type lookup is cheaper than isinstance() and leaves out bools.
+_SEED_VALUE_TYPES = frozenset((int, float))
+
+# Valid control_after_generate widget values.
+_CAG_ACTIONS = frozenset(("fixed", "increment", "decrement", "randomize"))
+
 # Default upper bound — matches ComfyUI's standard INT widget range.
 _DEFAULT_SEED_MAX = 0xFFFFFFFFFFFFFFFF
 
+# Dedicated generator for rerun seeds: one bound-method call per seed, and
+# it leaves the global ``random`` state (which nodes may seed) untouched.
+_RNG = random.Random()
+
 
 def _get_seed_range_for_node(class_type: str, seed_key: str) -> tuple[int, int]:
     """Return ``(min, max)`` for *seed_key* as declared in the node's
-    ``INPUT_TYPES``.  Falls back to ``(0, _DEFAULT_SEED_MAX)``."""
+    ``INPUT_TYPES``.  Falls back to ``(0, _DEFAULT_SEED_MAX)``.
+
+    Per call this is one registry ``dict.get`` plus a cache hit: the
+    ``INPUT_TYPES()`` reflection is memoised per class object (so a
+    replaced registry entry is re-derived without any version counter).
+    """
+    # ComfyUI's ``nodes`` module is loaded before any custom node; reading
+    # it from sys.modules skips the import machinery on this hot path.
+    nodes = sys.modules.get("nodes")
     try:
-        import nodes
         cls = nodes.NODE_CLASS_MAPPINGS.get(class_type)
-        if cls is None:
-            return 0, _DEFAULT_SEED_MAX
+    except Exception:
+        return 0, _DEFAULT_SEED_MAX
+    if cls is None:
+        return 0, _DEFAULT_SEED_MAX
+    return _get_seed_range_for_class(cls, seed_key)
+
+
+@functools.lru_cache(maxsize=512)
+def _get_seed_range_for_class(cls, seed_key: str) -> tuple[int, int]:
+    """Cached ``INPUT_TYPES()`` lookup behind :func:`_get_seed_range_for_node`.
+
+    Keyed on the class object itself, so a node class that is replaced
+    in ``NODE_CLASS_MAPPINGS`` (e.g. by a late-loading extension) is
+    looked up afresh.
+    """
+    try:
         input_types = cls.INPUT_TYPES()
         for section in ("required", "optional"):
             section_dict = input_types.get(section, {})
@@ -626,179 +1134,204 @@ def _get_seed_range_for_node(class_type: str, seed_key: str) -> tuple[int, int]:
     return 0, _DEFAULT_SEED_MAX
 
 
-def _clamp_seed_values(prompt: dict, extra_data: dict | None = None) -> None:
-    """Clamp every seed-like INT input to its node-defined range.
+def _extract_workflow_meta(extra_data: dict | None) -> tuple[dict | None, dict]:
+    """Return ``(seed_widget_map, workflow_nodes_by_id)`` from the workflow
+    metadata in *extra_data*.
 
-    This prevents ``validate_prompt`` from rejecting nodes whose cached
-    seed value exceeds the ``max`` declared in their ``INPUT_TYPES``.
+    ``seed_widget_map`` maps node_id_str → widget_idx (``None`` if the
+    workflow carries no ``seed_widgets``); ``workflow_nodes_by_id`` maps
+    node_id_str → workflow node dict.  Built once per rerun for
+    :func:`_process_seed_nodes`.
 
-    Uses ``seed_widgets`` from the workflow metadata (if available) to
-    reliably identify seed inputs and keep ``widgets_values`` in sync.
-    Falls back to scanning ``_SEED_INPUT_KEYS`` in the prompt dict.
+    Node ids are canonicalised here (the workflow stores them as ints, the
+    prompt as strings): every key is an interned ``str``.
     """
-    import random
-
     seed_widget_map: dict | None = None
     workflow_nodes_by_id: dict = {}
     try:
         wf = extra_data["extra_pnginfo"]["workflow"]
         seed_widget_map = wf.get("seed_widgets")
+        if isinstance(seed_widget_map, dict):
+            seed_widget_map = {
+                sys.intern(str(nid)): idx for nid, idx in seed_widget_map.items()
+            }
         for n in wf.get("nodes", []):
-            workflow_nodes_by_id[str(n["id"])] = n
+            workflow_nodes_by_id[sys.intern(str(n["id"]))] = n
     except (KeyError, TypeError, AttributeError):
         pass
+    return seed_widget_map, workflow_nodes_by_id
 
-    for node_id, node_data in prompt.items():
-        if not isinstance(node_data, dict):
-            continue
-        class_type = node_data.get("class_type", "")
-        inputs = node_data.get("inputs")
-        if not isinstance(inputs, dict):
-            continue
 
-        # Check every seed-like key in this node's inputs
-        for seed_key in _SEED_INPUT_KEYS:
-            if seed_key not in inputs or not isinstance(inputs[seed_key], (int, float)):
-                continue
-            val = int(inputs[seed_key])
-            lo, hi = _get_seed_range_for_node(class_type, seed_key)
-            if val < lo or val > hi:
-                inputs[seed_key] = random.randint(lo, hi)
-                # Also sync widgets_values via seed_widget_map
-                wf_node = workflow_nodes_by_id.get(node_id)
-                wv_idx = (seed_widget_map or {}).get(node_id)
-                if wf_node and wv_idx is not None:
-                    wv = wf_node.get("widgets_values")
-                    if isinstance(wv, list) and wv_idx < len(wv):
-                        wv[wv_idx] = inputs[seed_key]
-
-
-def _apply_control_after_generate(prompt: dict, extra_data: dict,
-                                  skip_nodes: set[str] | None = None) -> None:
-    """Apply per-widget ``control_after_generate`` rules to seed inputs.
-
-    This function handles **standard ComfyUI seed widgets** that are NOT
-    managed by any third-party ``on_prompt_handler`` hook.  Third-party
-    global-seed nodes (Easy-Use, Inspire-Pack, Impact-Pack, etc.) are
-    handled *universally* by calling ``trigger_on_prompt`` in the rerun
-    handler **before** this function is invoked.
-
-    *skip_nodes* — node IDs whose seeds were already modified by a hook
-    and must NOT be touched again.
-
-    Strategy:
-      1. **seed_widgets** map (from workflow metadata) — for every
-         node ID in this map, read the ``control_after_generate``
-         action string from ``widgets_values[widget_idx + 1]``.
-      2. **Fallback** — for nodes NOT in ``seed_widgets``, scan for
-         ``seed`` / ``noise_seed`` / ``seed_num`` inputs and try to
-         discover the action from ``widgets_values`` via value-matching.
-
-    All generated seed values are clamped to the node's declared min/max.
+def _seed_range(ranges: dict, class_type: str, seed_key: str) -> tuple[int, int]:
+    """:func:`_get_seed_range_for_node` memoised in the per-pass *ranges* dict.
+
+    Workflows repeat the same few sampler classes, so each
+    ``(class_type, seed_key)`` is resolved once per pass.
+    """
+    rng = ranges.get((class_type, seed_key))
+    if rng is None:
+        rng = ranges[(class_type, seed_key)] = _get_seed_range_for_node(class_type, seed_key)
+    return rng
+
+
+def _clamp_node_seeds(node_id: str, inputs: dict, class_type: str,
+                      seed_widget_map: dict | None, wf_node: dict | None,
+                      ranges: dict) -> None:
+    """Clamp one node's seed-like inputs (see :func:`_process_seed_nodes`)."""
+    for seed_key in _SEED_INPUT_KEYS:
+        if seed_key not in inputs or type(inputs[seed_key]) not in _SEED_VALUE_TYPES:
+            continue
+        val = int(inputs[seed_key])
+        lo, hi = _seed_range(ranges, class_type, seed_key)
+        if val < lo or val > hi:
+            inputs[seed_key] = _RNG.randint(lo, hi)
+            # Also sync widgets_values via seed_widget_map
+            wv_idx = (seed_widget_map or {}).get(node_id)
+            if wf_node and wv_idx is not None:
+                wv = wf_node.get("widgets_values")
+                if isinstance(wv, list) and wv_idx < len(wv):
+                    wv[wv_idx] = inputs[seed_key]
+
+
+def _cag_by_seed_widget(inputs: dict, class_type: str, wf_node: dict | None,
+                        wv_idx: int, ranges: dict) -> bool:
+    """Strategy 1 of :func:`_process_seed_nodes` for one node.
+
+    Returns True if a seed input was found (the node is then handled).
     """
-    if skip_nodes is None:
-        skip_nodes = set()
+    wv = wf_node.get("widgets_values") if wf_node else None
+
+    # Read action from widgets_values[wv_idx + 1]
+    action = "randomize"  # default
+    if isinstance(wv, list) and wv_idx + 1 < len(wv):
+        candidate = wv[wv_idx + 1]
+        if isinstance(candidate, str) and candidate in _CAG_ACTIONS:
+            action = candidate
+
+    # Find the seed input key and apply the action
+    for sk in ("seed_num", "seed", "noise_seed"):
+        if sk in inputs and type(inputs[sk]) in _SEED_VALUE_TYPES:
+            lo, hi = _seed_range(ranges, class_type, sk)
+            inputs[sk] = _apply_seed_action(int(inputs[sk]), action, hi, lo)
+            # Sync widgets_values
+            if isinstance(wv, list) and wv_idx < len(wv):
+                wv[wv_idx] = inputs[sk]
+            return True
+    return False
+
+
+def _cag_by_widget_values(inputs: dict, class_type: str, wf_node: dict | None,
+                          ranges: dict) -> None:
+    """Strategy 2 of :func:`_process_seed_nodes` for one node."""
+    # Most nodes carry no seed at all; bail out before touching the
+    # workflow node so only seeded nodes pay for the widget scan.
+    seed_keys = [
+        sk for sk in _SEED_INPUT_KEYS
+        if sk in inputs and type(inputs[sk]) in _SEED_VALUE_TYPES
+    ]
+    if not seed_keys:
+        return
+    wv = wf_node.get("widgets_values") if wf_node else None
+
+    # Index once per node: widget slots that are immediately followed
+    # by a control_after_generate action string (usually just one).
+    action_slots: list[int] = []
+    if isinstance(wv, list):
+        action_slots = [
+            idx for idx in range(len(wv) - 1)
+            if isinstance(wv[idx + 1], str) and wv[idx + 1] in _CAG_ACTIONS
+        ]
+
+    for seed_key in seed_keys:
+        lo, hi = _seed_range(ranges, class_type, seed_key)
+
+        # Try to discover the action from widgets_values
+        action = "randomize"  # default for nodes without metadata
+        seed_val = inputs[seed_key]
+        found_idx = None
+        for idx in action_slots:
+            if wv[idx] == seed_val:
+                action = wv[idx + 1]
+                found_idx = idx
+                break
+
+        inputs[seed_key] = _apply_seed_action(
+            int(inputs[seed_key]), action, hi, lo
+        )
 
-    # ── Extract workflow metadata ──
-    seed_widget_map: dict | None = None   # node_id_str → widget_idx
-    workflow_nodes_by_id: dict = {}
-    try:
-        wf = extra_data["extra_pnginfo"]["workflow"]
-        seed_widget_map = wf.get("seed_widgets")
-        for n in wf.get("nodes", []):
-            workflow_nodes_by_id[str(n["id"])] = n
-    except (KeyError, TypeError):
-        pass
+        # Sync widgets_values: the slot the seed was matched in, else
+        # (best-effort) the first action-tagged slot
+        if found_idx is not None:
+            wv[found_idx] = inputs[seed_key]
+        elif action_slots:
+            wv[action_slots[0]] = inputs[seed_key]
+
+
+def _seeds_differ(inputs: dict, old_seeds: dict[str, int]) -> bool:
+    """True if any seed in *old_seeds* now has a different value in *inputs*."""
+    for sk, old_val in old_seeds.items():
+        cur = inputs.get(sk)
+        if type(cur) is int:  # the usual case — compare without int()
+            if cur != old_val:
+                return True
+        elif type(cur) is float and int(cur) != old_val:
+            return True
+    return False
+
+
+def _process_seed_nodes(prompt: dict, extra_data: dict | None,
+                        seed_snapshot: dict[str, dict[str, int]] | None = None,
+                        workflow_meta: tuple | None = None) -> None:
+    """Rerun seed handling in a single walk over *prompt*.
+
+    For each node: if *seed_snapshot* is given (New Task mode) and no
+    ``on_prompt`` hook changed the node's seeds relative to it, apply the
+    node's ``control_after_generate`` action; then clamp every seed-like
+    input to its declared range so ``validate_prompt`` accepts it.
+    Same Task mode passes ``seed_snapshot=None`` and only clamps.
+
+    The action is found by one of two strategies:
+      1. **seed_widgets** map (from workflow metadata) — read the action
+         from ``widgets_values[widget_idx + 1]``.
+      2. **Fallback** — for nodes not in the map, discover the action
+         from ``widgets_values`` by matching the seed value.
+    """
+    if workflow_meta is None:
+        workflow_meta = _extract_workflow_meta(extra_data)
+    seed_widget_map, workflow_nodes_by_id = workflow_meta
+    widget_map = seed_widget_map if isinstance(seed_widget_map, dict) else {}
+    ranges: dict = {}
 
-    # ── Strategy 1: use seed_widgets for reliable widget-index lookup ──
-    handled_nodes: set[str] = set()
-    if seed_widget_map:
-        for nid, wv_idx in seed_widget_map.items():
-            if nid not in prompt or nid in skip_nodes:
-                continue
-            ndata = prompt[nid]
-            if not isinstance(ndata, dict):
-                continue
-            class_type = ndata.get("class_type", "")
-            inputs = ndata.get("inputs", {})
-            wf_node = workflow_nodes_by_id.get(nid)
-            wv = wf_node.get("widgets_values") if wf_node else None
-
-            # Read action from widgets_values[wv_idx + 1]
-            action = "randomize"  # default
-            if isinstance(wv, list) and wv_idx + 1 < len(wv):
-                candidate = wv[wv_idx + 1]
-                if isinstance(candidate, str) and candidate in (
-                    "fixed", "increment", "decrement", "randomize"
-                ):
-                    action = candidate
-
-            # Find the seed input key and apply the action
-            for sk in ("seed_num", "seed", "noise_seed"):
-                if sk in inputs and isinstance(inputs[sk], (int, float)):
-                    lo, hi = _get_seed_range_for_node(class_type, sk)
-                    inputs[sk] = _apply_seed_action(
-                        int(inputs[sk]), action, hi, lo
-                    )
-                    # Sync widgets_values
-                    if isinstance(wv, list) and wv_idx < len(wv):
-                        wv[wv_idx] = inputs[sk]
-                    handled_nodes.add(nid)
-                    break
-
-    # ── Strategy 2: nodes NOT in seed_widget_map ──
-    # Use the workflow node's widgets_values to find control_after_generate.
     for nid, ndata in prompt.items():
         if not isinstance(ndata, dict):
             continue
-        if nid in handled_nodes or nid in skip_nodes:
-            continue  # already handled via seed_widget_map or hook
         inputs = ndata.get("inputs")
         if not isinstance(inputs, dict):
             continue
+        # Most nodes have no seed input at all: one C-level set probe
+        # skips both passes' helper calls for them.
+        if inputs.keys().isdisjoint(_SEED_INPUT_KEYS):
+            continue
         class_type = ndata.get("class_type", "")
-
         wf_node = workflow_nodes_by_id.get(nid)
-        wv = wf_node.get("widgets_values") if wf_node else None
 
-        for seed_key in _SEED_INPUT_KEYS:
-            if seed_key not in inputs or not isinstance(inputs[seed_key], (int, float)):
-                continue
-            lo, hi = _get_seed_range_for_node(class_type, seed_key)
-
-            # Try to discover the action from widgets_values
-            action = "randomize"  # default for nodes without metadata
-            if isinstance(wv, list):
-                seed_val = inputs[seed_key]
-                for idx, wv_val in enumerate(wv):
-                    if wv_val == seed_val and idx + 1 < len(wv):
-                        candidate = wv[idx + 1]
-                        if isinstance(candidate, str) and candidate in (
-                            "fixed", "increment", "decrement", "randomize"
-                        ):
-                            action = candidate
-                            break
-
-            inputs[seed_key] = _apply_seed_action(
-                int(inputs[seed_key]), action, hi, lo
-            )
+        if seed_snapshot is not None:
+            # Seeds a hook already changed are left to that hook
+            old_seeds = seed_snapshot.get(nid)
+            if old_seeds is None or not _seeds_differ(inputs, old_seeds):
+                wv_idx = widget_map.get(nid)
+                if wv_idx is None or not _cag_by_seed_widget(
+                        inputs, class_type, wf_node, wv_idx, ranges):
+                    _cag_by_widget_values(inputs, class_type, wf_node, ranges)
 
-            # Sync widgets_values (best-effort value search)
-            if isinstance(wv, list):
-                for idx, wv_val in enumerate(wv):
-                    if idx + 1 < len(wv) and isinstance(wv[idx + 1], str) and wv[idx + 1] in (
-                        "fixed", "increment", "decrement", "randomize"
-                    ):
-                        wv[idx] = inputs[seed_key]
-                        break
+        _clamp_node_seeds(nid, inputs, class_type, seed_widget_map, wf_node, ranges)
 
 
 def _apply_seed_action(current: int, action: str, max_seed: int,
                        min_seed: int = 0) -> int:
     """Apply a control_after_generate action to a seed value."""
-    import random
     if action == "randomize":
-        return random.randint(min_seed, max_seed)
+        return _RNG.randint(min_seed, max_seed)
     elif action == "increment":
         return (current + 1) if current < max_seed else min_seed
     elif action == "decrement":
@@ -814,7 +1347,6 @@ def _try_load_from_history() -> bool:
     the server's execution history for the most recent entry and use
     its prompt/extra_data.  Returns True if successful.
     """
-    import copy
     with _workflow_status_lock:
         if _user_prompt is not None:
             return True  # already have one
@@ -830,9 +1362,15 @@ def _try_load_from_history() -> bool:
         prompt_tuple = entry.get("prompt")
         if not prompt_tuple or len(prompt_tuple) < 4:
             return False
-        prompt_dict = copy.deepcopy(prompt_tuple[2])
-        extra_data = copy.deepcopy(prompt_tuple[3]) if prompt_tuple[3] else {}
-        _set_user_prompt(prompt_dict, extra_data)
+        # History entries are live server objects — copy exactly once here
+        # (the snapshot also serves the rerun that triggered this load)
+        frozen = _freeze_json([prompt_tuple[2], prompt_tuple[3] or {}])
+        if frozen is None:
+            prompt_dict = _clone_unfreezable(prompt_tuple[2])
+            extra_data = _clone_unfreezable(prompt_tuple[3]) if prompt_tuple[3] else {}
+        else:
+            prompt_dict, extra_data = _thaw_json(frozen)
+        _set_user_prompt(prompt_dict, extra_data, frozen)
         return True
     except Exception:
         return False
@@ -857,72 +1395,160 @@ def _clear_pending_queue(srv) -> None:
 _routes_registered = False
 
 
+def _read_file_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
 def _register_routes() -> None:
     """Register custom HTTP routes on the PromptServer singleton.
 
     Provides:
         GET /simple_utility/global_image_preview/latest          — JSON of latest images
         GET /simple_utility/global_image_preview/latest_preview   — raw JPEG of latest step preview
+        GET /simple_utility/global_image_preview/poll             — long-poll: images + status
         GET /simple_utility/global_image_preview/viewer           — fullscreen HTML viewer
     """
     global _routes_registered
     if _routes_registered:
         return
-    _routes_registered = True
 
     try:
         from server import PromptServer
-        from aiohttp import web
+        from aiohttp import hdrs, web
+        from multidict import CIMultiDict, CIMultiDictProxy
+        # ComfyUI core modules used by the rerun / interrupt handlers —
+        # resolved once here instead of on every request.
+        import execution
+        import nodes as comfy_nodes
     except ImportError:
         return
     if not hasattr(PromptServer, "instance") or PromptServer.instance is None:
         return
+    _routes_registered = True  # sticky once the server exists (see above)
 
     routes = PromptServer.instance.routes
 
-    # All polling endpoints MUST include Cache-Control: no-store.
-    # Without it, browsers may apply heuristic caching for non-loopback
-    # origins (e.g. LAN IPs like 192.168.x.x) while bypassing cache for
-    # 127.0.0.1, causing the standalone viewer to never refresh on LAN.
-    _NO_CACHE_HDRS = {
-        "Cache-Control": "no-cache, no-store, must-revalidate",
-        "Pragma": "no-cache",
-        "Expires": "0",
-    }
+    # Every polling endpoint MUST send an explicit Cache-Control: either
+    # no-store, or no-cache together with an ETag (/latest,
+    # /latest_preview) — never none at all.  Without one, browsers may
+    # apply heuristic caching for non-loopback origins (e.g. LAN IPs like
+    # 192.168.x.x) while bypassing cache for 127.0.0.1, causing the
+    # standalone viewer to never refresh on LAN.
+    #
+    # Built once as read-only multidicts keyed by aiohttp's pre-folded
+    # ``istr`` names, so each response's header copy is a plain multidict
+    # copy rather than a fresh case-insensitive build from a dict.
+    _NO_CACHE_HDRS = CIMultiDictProxy(CIMultiDict((
+        (hdrs.CACHE_CONTROL, "no-cache, no-store, must-revalidate"),
+        (hdrs.PRAGMA, "no-cache"),
+        (hdrs.EXPIRES, "0"),
+    )))
+    # /latest and /latest_preview carry an ETag derived from the counters,
+    # so they only forbid reuse without revalidation.  no-cache (unlike a
+    # missing Cache-Control) still rules out heuristic caching on LAN.
+    # The per-response ETag is set on the constructed response, so these
+    # shared headers are passed through unchanged like _NO_CACHE_HDRS.
+    _REVALIDATE_HDRS = CIMultiDictProxy(CIMultiDict((
+        (hdrs.CACHE_CONTROL, "no-cache"),
+        (hdrs.PRAGMA, "no-cache"),
+        (hdrs.EXPIRES, "0"),
+    )))
+
+    def _json_response(payload, status: int = 200, headers=None):
+        """``web.json_response`` serialized via :func:`_dump_json_bytes`
+        (orjson when available) and handed to aiohttp as ready bytes."""
+        return _json_body_response(_dump_json_bytes(payload), status, headers)
+
+    def _json_body_response(body: bytes, status: int = 200, headers=None):
+        return web.Response(
+            body=body,
+            status=status,
+            content_type="application/json",
+            headers=headers,
+        )
 
-    @routes.get("/simple_utility/global_image_preview/latest")
-    async def _api_latest(request):
-        """Return the latest executed-event images as JSON.
+    def _with_etag(resp, etag: str):
+        resp.headers[hdrs.ETAG] = etag
+        return resp
+
+    # Last serialized body of each polling endpoint: ``{name: (key, bytes)}``.
+    # The key covers everything the body depends on, so tabs polling the
+    # same state (e.g. all woken by one /poll notify) share one
+    # serialization.  Only touched from handlers on the server loop.
+    _body_cache: dict = {}
+
+    def _cached_body(name: str, key: tuple, build) -> bytes:
+        hit = _body_cache.get(name)
+        if hit is not None and hit[0] == key:
+            return hit[1]
+        body = _dump_json_bytes(build())
+        _body_cache[name] = (key, body)
+        return body
+
+    def _etag_matches(request, etag: str) -> bool:
+        inm = request.headers.get("If-None-Match")
+        if not inm:
+            return False
+        return any(tag.strip().removeprefix("W/") in (etag, "*") for tag in inm.split(","))
 
-        Query parameters:
-            since (int, optional): If provided, the response includes a
-                ``new_batches`` list with every image batch whose counter
-                is greater than *since*.  This lets the viewer catch up
-                on ALL images produced since its last poll — including
-                batches from Save Image, Preview Image, and any other
-                node that outputs images.
-        """
-        images, images_counter = get_latest_images()
-        blob, preview_counter = get_latest_preview_blob()
+    def _query_int(request, name: str, default: int) -> int:
+        try:
+            return int(request.query.get(name, default))
+        except (ValueError, TypeError):
+            return default
+
+    def _latest_payload(images, images_counter, blob, preview_counter, since) -> dict:
         payload = {
             "images": images,
             "images_counter": images_counter,
             "has_preview_blob": blob is not None,
             "preview_counter": preview_counter,
         }
-        # If the viewer passes ?since=N we return all batches missed
-        since_raw = request.query.get("since")
-        if since_raw is not None:
-            try:
-                since = int(since_raw)
-            except (ValueError, TypeError):
-                since = 0
+        # If the viewer passes a since counter we return all batches missed
+        if since is not None:
             entries, _ = get_images_since(max(0, since))
             payload["new_batches"] = [
                 {"counter": c, "images": imgs}
                 for c, imgs in entries
             ]
-        return web.json_response(payload, headers=_NO_CACHE_HDRS)
+        return payload
+
+    def _status_payload() -> dict:
+        st = get_workflow_status()
+        # Include queue_pending so the viewer can avoid duplicate submissions
+        try:
+            st["queue_pending"] = PromptServer.instance.prompt_queue.get_tasks_remaining()
+        except Exception:
+            st["queue_pending"] = 0
+        return st
+
+    @routes.get("/simple_utility/global_image_preview/latest")
+    async def _api_latest(request):
+        """Return the latest executed-event images as JSON.
+
+        Query parameters:
+            since (int, optional): If provided, the response includes a
+                ``new_batches`` list with every image batch whose counter
+                is greater than *since*.  This lets the viewer catch up
+                on ALL images produced since its last poll — including
+                batches from Save Image, Preview Image, and any other
+                node that outputs images.
+        """
+        # Generation first: a clear racing with the snapshot reads then
+        # yields a key no later request repeats, never a stale cache hit.
+        generation = _history_generation
+        images, images_counter = _latest_images_snapshot
+        blob, preview_counter = _latest_preview_snapshot
+        # The body is fully determined by the URL (?since) plus these three
+        # values, so nothing needs to be serialized when they are unchanged.
+        etag = f'"{generation}-{images_counter}-{preview_counter}"'
+        if _etag_matches(request, etag):
+            return _with_etag(web.Response(status=304, headers=_REVALIDATE_HDRS), etag)
+        since = _query_int(request, "since", 0) if "since" in request.query else None
+        body = _cached_body("latest", (etag, since), lambda: _latest_payload(
+            images, images_counter, blob, preview_counter, since))
+        return _with_etag(_json_body_response(body, headers=_REVALIDATE_HDRS), etag)
 
     @routes.post("/simple_utility/global_image_preview/clear_history")
     async def _api_clear_history(request):
@@ -932,7 +1558,7 @@ def _register_routes() -> None:
         baseline without re-fetching cleared data.
         """
         counter = clear_image_history()
-        return web.json_response(
+        return _json_response(
             {"status": "cleared", "images_counter": counter},
             headers=_NO_CACHE_HDRS,
         )
@@ -943,25 +1569,68 @@ def _register_routes() -> None:
         blob, counter = get_latest_preview_blob()
         if blob is None:
             return web.Response(status=204, headers=_NO_CACHE_HDRS)
-        return web.Response(
+        etag = f'"{counter}"'
+        if _etag_matches(request, etag):
+            return _with_etag(web.Response(status=304, headers=_REVALIDATE_HDRS), etag)
+        resp = web.Response(
             body=blob,
             content_type="image/jpeg",
-            headers={
-                **_NO_CACHE_HDRS,
-                "X-Preview-Counter": str(counter),
-            },
+            headers=_REVALIDATE_HDRS,
         )
+        resp.headers["X-Preview-Counter"] = str(counter)
+        return _with_etag(resp, etag)
 
     @routes.get("/simple_utility/global_image_preview/status")
     async def _api_status(request):
         """Return workflow execution status + queue info for smart retry."""
-        st = get_workflow_status()
-        # Include queue_pending so the viewer can avoid duplicate submissions
-        try:
-            st["queue_pending"] = PromptServer.instance.prompt_queue.get_tasks_remaining()
-        except Exception:
-            st["queue_pending"] = 0
-        return web.json_response(st, headers=_NO_CACHE_HDRS)
+        st = _status_payload()
+        body = _cached_body("status", (st["status_counter"], st["queue_pending"]), lambda: st)
+        return _json_body_response(body, headers=_NO_CACHE_HDRS)
+
+    @routes.get("/simple_utility/global_image_preview/poll")
+    async def _api_poll(request):
+        """Long-poll for new images, previews and status changes.
+
+        Query parameters:
+            since_images (int): last ``images_counter`` the client has seen.
+            since_preview (int): last ``preview_counter`` the client has seen.
+            since_status (int): last ``status.status_counter`` seen.
+
+        Blocks (up to ~25 s) until any counter differs from the given value
+        (``!=`` rather than ``>`` so a server restart resets clients at once),
+        then returns the ``/latest`` payload (with ``new_batches`` since
+        *since_images*) plus ``status`` — one request instead of the
+        three-per-tick ``/latest`` + ``/status`` polling.
+        """
+        since_images = _query_int(request, "since_images", -1)
+        since_preview = _query_int(request, "since_preview", -1)
+        since_status = _query_int(request, "since_status", -1)
+
+        def _changed() -> bool:
+            return (_latest_images_snapshot[1] != since_images
+                    or _latest_preview_snapshot[1] != since_preview
+                    or _workflow_status_counter != since_status)
+
+        cond = _get_poll_condition()
+        async with cond:
+            try:
+                await asyncio.wait_for(cond.wait_for(_changed), timeout=25.0)
+            except asyncio.TimeoutError:
+                pass
+
+        generation = _history_generation  # read first, as in /latest
+        images, images_counter = _latest_images_snapshot
+        blob, preview_counter = _latest_preview_snapshot
+        st = _status_payload()
+        key = (generation, images_counter, preview_counter, since_images,
+               st["status_counter"], st["queue_pending"])
+
+        def _build() -> dict:
+            payload = _latest_payload(images, images_counter, blob, preview_counter, since_images)
+            payload["status"] = st
+            return payload
+
+        return _json_body_response(_cached_body("poll", key, _build), headers=_NO_CACHE_HDRS)
 
     @routes.post("/simple_utility/global_image_preview/rerun")
     async def _api_rerun(request):
@@ -979,11 +1648,7 @@ def _register_routes() -> None:
             so callers can poll ``GET /status`` and check ``last_rerun_id``
             to confirm their command was processed without ambiguity.
         """
-        global _rerun_in_progress, _last_rerun_id
-        import nodes as comfy_nodes
-        import asyncio
-        import copy
-        import random
+        global _rerun_in_progress, _last_rerun_id, _user_prompt_frozen
 
         body = {}
         try:
@@ -994,14 +1659,10 @@ def _register_routes() -> None:
         rerun_id = body.get("rerun_id", None)  # per-tab caller ID
 
         # ── Step 1: Interrupt current workflow if running ──
-        status = get_workflow_status()
-        if status["running"]:
+        if _workflow_running:
             comfy_nodes.interrupt_processing()
-            # Poll until the workflow is no longer running (max 5 s)
-            for _ in range(50):
-                await asyncio.sleep(0.1)
-                if not get_workflow_status()["running"]:
-                    break
+            # Wait until the workflow is no longer running (max 5 s)
+            await _wait_for_workflow_stop(5.0)
 
         # ── Step 2: Clear pending queue to avoid stacking reruns ──
         try:
@@ -1020,13 +1681,22 @@ def _register_routes() -> None:
 
         with _workflow_status_lock:
             if _user_prompt is None:
-                return web.json_response(
+                return _json_response(
                     {"error": "No previous prompt to rerun. "
                      "Run a workflow first or check history."},
                     status=400,
                 )
-            prompt = copy.deepcopy(_user_prompt)
-            extra_data = copy.deepcopy(_user_extra_data) if _user_extra_data else {}
+            # Repeated reruns of an unchanged prompt reuse one serialized
+            # snapshot, so each rerun only pays for the decode.
+            frozen = _user_prompt_frozen
+            if frozen is None:
+                frozen = _freeze_json([_user_prompt, _user_extra_data or {}])
+                _user_prompt_frozen = frozen
+            if frozen is None:
+                prompt = _clone_unfreezable(_user_prompt)
+                extra_data = _clone_unfreezable(_user_extra_data) if _user_extra_data else {}
+        if frozen is not None:
+            prompt, extra_data = _thaw_json(frozen)
 
         # ── Step 4 (New Task only): run on_prompt hooks + per-node CAG ──
         #
@@ -1047,15 +1717,15 @@ def _register_routes() -> None:
         # logic for *standard* ComfyUI seed widgets — these are NOT
         # handled by any hook (KSampler, etc.).
 
-        import uuid
         prompt_id = str(uuid.uuid4())
         srv = PromptServer.instance
+        seed_snapshot: dict[str, dict[str, int]] | None = None
 
         if mode == "new":
             # Snapshot seed values BEFORE hooks — so we can detect which
             # nodes were modified by a hook and avoid double-applying our
             # own per-node control_after_generate to those nodes.
-            seed_snapshot: dict[str, dict[str, int]] = {}
+            seed_snapshot = {}
             for nid, ndata in prompt.items():
                 if not isinstance(ndata, dict):
                     continue
@@ -1063,7 +1733,7 @@ def _register_routes() -> None:
                 if not isinstance(inputs, dict):
                     continue
                 for sk in _SEED_INPUT_KEYS:
-                    if sk in inputs and isinstance(inputs[sk], (int, float)):
+                    if sk in inputs and type(inputs[sk]) in _SEED_VALUE_TYPES:
                         seed_snapshot.setdefault(nid, {})[sk] = int(inputs[sk])
 
             # Build the json_data envelope that trigger_on_prompt expects
@@ -1078,41 +1748,28 @@ def _register_routes() -> None:
             prompt = json_data.get("prompt", prompt)
             extra_data = json_data.get("extra_data", extra_data)
 
-            # Determine which nodes had their seeds changed by hooks
-            hook_modified_nodes: set[str] = set()
-            for nid, old_seeds in seed_snapshot.items():
-                if nid not in prompt:
-                    continue
-                ndata = prompt[nid]
-                if not isinstance(ndata, dict):
-                    continue
-                inputs = ndata.get("inputs", {})
-                for sk, old_val in old_seeds.items():
-                    cur = inputs.get(sk)
-                    if isinstance(cur, (int, float)) and int(cur) != old_val:
-                        hook_modified_nodes.add(nid)
-                        break
-
-            # Apply per-node control_after_generate for standard seed
-            # widgets (KSampler etc.) that no hook has already modified.
-            _apply_control_after_generate(prompt, extra_data,
-                                          skip_nodes=hook_modified_nodes)
-
-        # ── Step 4b: Clamp seed values to each node's declared range ──
-        # This is necessary for BOTH modes because the cached prompt may
-        # contain seed values that were valid in a different context (e.g.
-        # the frontend randomised within 64-bit range but the node only
-        # accepts 32-bit seeds).  validate_prompt would reject such nodes.
-        _clamp_seed_values(prompt, extra_data)
+        # ── Step 4b: control_after_generate + clamp, in one pass ──
+        # New Task: per-node control_after_generate for standard seed
+        # widgets (KSampler etc.) whose seeds no hook changed relative to
+        # seed_snapshot.  Both modes: clamp seeds to each node's declared
+        # range, because the cached prompt may contain seed values that
+        # were valid in a different context (e.g. the frontend randomised
+        # within 64-bit range but the node only accepts 32-bit seeds).
+        # validate_prompt would reject such nodes.
+        _process_seed_nodes(prompt, extra_data, seed_snapshot)
 
         # ── Step 5: Apply node replacements (same as /prompt route) ──
-        try:
-            srv.node_replace_manager.apply_replacements(prompt)
-        except Exception:
-            pass
+        # Older ComfyUI builds have no node_replace_manager at all.
+        apply_replacements = getattr(
+            getattr(srv, "node_replace_manager", None), "apply_replacements", None
+        )
+        if apply_replacements is not None:
+            try:
+                apply_replacements(prompt)
+            except Exception as e:
+                _console_log(f"[Global-Image-Preview] Rerun: node replacement failed: {e!r}")
 
         try:
-            import execution
             valid = await execution.validate_prompt(prompt_id, prompt, None)
             if valid[0]:
                 outputs_to_execute = valid[2]
@@ -1127,22 +1784,30 @@ def _register_routes() -> None:
                 srv.number += 1
                 # Update _user_prompt so the NEXT rerun always uses the
                 # very last queued workflow (not the original one).
-                import copy as _copy
-                _set_user_prompt(_copy.deepcopy(prompt), _copy.deepcopy(extra_data))
+                # Like _patched_put, keep references to what was queued;
+                # the serialized snapshot taken here is what the next rerun
+                # decodes, so later changes to these objects can't leak in.
+                # A rerun that changed nothing (typically Same Task with
+                # in-range seeds) leaves the stored prompt and its disk copy
+                # alone.
+                queued = _freeze_json([prompt, extra_data])
+                if queued is None or queued != frozen or _user_prompt_frozen is not frozen:
+                    _set_user_prompt(prompt, extra_data, queued)
                 # Track the rerun_id so callers can confirm processing
                 with _workflow_status_lock:
                     _last_rerun_id = rerun_id
-                return web.json_response(
+                    _bump_workflow_status_locked()
+                return _json_response(
                     {"prompt_id": prompt_id, "status": "queued",
                      "mode": mode, "rerun_id": rerun_id}
                 )
             else:
-                return web.json_response(
+                return _json_response(
                     {"error": str(valid[1])}, status=400
                 )
         except Exception as e:
             _rerun_in_progress = False
-            return web.json_response({"error": str(e)}, status=500)
+            return _json_response({"error": str(e)}, status=500)
 
     @routes.post("/simple_utility/global_image_preview/interrupt")
     async def _api_interrupt(request):
@@ -1156,8 +1821,6 @@ def _register_routes() -> None:
         Does nothing if no workflow is running (returns success immediately).
         """
         global _last_interrupt_id
-        import nodes as comfy_nodes
-        import asyncio
 
         body = {}
         try:
@@ -1166,30 +1829,27 @@ def _register_routes() -> None:
             pass
         interrupt_id = body.get("interrupt_id", None)
 
-        status = get_workflow_status()
-        if status["running"]:
+        # A single bool read needs no lock (nor a full status snapshot);
+        # the lock is taken once, below, to publish the interrupt_id.
+        running = _workflow_running
+        if running:
             comfy_nodes.interrupt_processing()
-            # Poll until the workflow is no longer running (max 5 s)
-            for _ in range(50):
-                await asyncio.sleep(0.1)
-                if not get_workflow_status()["running"]:
-                    break
+            # Wait until the workflow is no longer running (max 5 s)
+            await _wait_for_workflow_stop(5.0)
 
         with _workflow_status_lock:
             _last_interrupt_id = interrupt_id
+            _bump_workflow_status_locked()
 
-        return web.json_response({
-            "status": "interrupted" if status["running"] else "idle",
+        return _json_response({
+            "status": "interrupted" if running else "idle",
             "interrupt_id": interrupt_id,
         })
 
     @routes.get("/simple_utility/global_image_preview/favicon.ico")
     async def _api_favicon(request):
         """Serve the favicon for the standalone viewer page."""
-        ico_path = os.path.join(
-            os.path.dirname(__file__), "..", "web", "assets", "favicon.ico"
-        )
-        ico_path = os.path.normpath(ico_path)
+        ico_path = _FAVICON_PATH
         if os.path.isfile(ico_path):
             return web.FileResponse(ico_path, headers={
                 "Content-Type": "image/x-icon",
@@ -1204,19 +1864,14 @@ def _register_routes() -> None:
         path = _safe_join(_cache_directory_path(), "", cache_file)
         if not path or not os.path.isfile(path):
             return web.Response(status=404, headers=_NO_CACHE_HDRS)
-        headers = {
-            "Cache-Control": "no-cache, no-store, must-revalidate",
-            "Pragma": "no-cache",
-            "Expires": "0",
-        }
         try:
             return web.FileResponse(
                 path,
-                headers=headers,
+                headers=_NO_CACHE_HDRS,
                 chunk_size=256 * 1024,
             )
         except TypeError:
-            return web.FileResponse(path, headers=headers)
+            return web.FileResponse(path, headers=_NO_CACHE_HDRS)
 
     @routes.get("/simple_utility/global_image_preview/viewer")
     async def _viewer_page(request):
@@ -1228,36 +1883,58 @@ def _register_routes() -> None:
         date and serve a stale copy — particularly on non-loopback origins
         (LAN IPs) where some browsers are more aggressive with caching.
         """
-        html_path = os.path.join(
-            os.path.dirname(__file__), "..", "web", "global_image_preview_viewer.html"
-        )
-        html_path = os.path.normpath(html_path)
-        if os.path.isfile(html_path):
-            # Read the file and return as a normal Response with cache headers
-            # instead of FileResponse, because FileResponse does not allow
-            # overriding Cache-Control (it only sets ETag/Last-Modified).
+        global _viewer_html_cache
+        html_path = _VIEWER_HTML_PATH
+        try:
+            st = os.stat(html_path)
+        except OSError:
+            st = None
+        if st is not None:
+            # Serve the (small, hot) page from memory; the stat keeps edits
+            # to the HTML live without a restart.  If that fails, fall back
+            # to a sendfile-backed FileResponse carrying the same no-cache
+            # headers (it only adds ETag/Last-Modified of its own).
             try:
-                with open(html_path, "r", encoding="utf-8") as f:
-                    html_content = f.read()
+                cached = _viewer_html_cache
+                if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+                    # Cold read off the event loop (slow disk must not
+                    # stall preview polling); hits only cost the stat.
+                    data = await asyncio.to_thread(_read_file_bytes, html_path)
+                    cached = (st.st_mtime_ns, st.st_size, data)
+                    _viewer_html_cache = cached
                 return web.Response(
-                    text=html_content,
-                    content_type="text/html; charset=utf-8",
+                    body=cached[2],
+                    content_type="text/html",
+                    charset="utf-8",
                     headers=_NO_CACHE_HDRS,
                 )
             except Exception:
-                return web.FileResponse(html_path)
+                return web.FileResponse(html_path, headers=_NO_CACHE_HDRS)
         return web.Response(
             text="<html><body><h1>Viewer HTML not found</h1></body></html>",
             content_type="text/html",
         )
 
 
+# True once both the server hook and the routes are in place.
+_initialized = False
+
+
+def _ensure_initialized() -> None:
+    """Install the server hook and routes (each retried until it sticks)."""
+    global _initialized
+    if not _hook_installed:
+        _install_server_hook()
+    if not _routes_registered:
+        _register_routes()
+    _initialized = _hook_installed and _routes_registered
+
+
 # Run at import time
 try:
     atexit.register(_shutdown_cleanup)
     _startup_cleanup()
-    _install_server_hook()
-    _register_routes()
+    _ensure_initialized()
 except Exception:
     pass
 
@@ -1297,12 +1974,17 @@ class SimpleGlobalImagePreview:
     @classmethod
     def IS_CHANGED(cls, **kwargs):
         """Always re-execute so the node stays alive in the execution graph."""
+        # Deliberately a fresh NaN per call: ComfyUI embeds this value in
+        # the cache signature, and tuple/list equality short-circuits on
+        # identity, so a shared NaN (or any shared "never equal" sentinel)
+        # would compare equal to itself and get the node cached.
         return float("NaN")
 
     def execute(self, unique_id: str = None):
-        # Ensure hooks / routes are in place (retry if earlier attempt failed)
-        _install_server_hook()
-        _register_routes()
+        # Ensure hooks / routes are in place (retry if the import-time
+        # attempt ran before the server existed); one bool check once done.
+        if not _initialized:
+            _ensure_initialized()
 
         # We intentionally return an empty ui dict so the node does NOT
         # push anything into the ComfyUI image feed.
@@ -5,11 +5,14 @@ vram_cache_saving, vram_cache_loading, and vram_ram_cache_clearing modules.
 """
 
 import atexit
+import functools
 import gc
+import itertools
 import json as _json
 import logging
 import mmap
 import os
+import pickle
 import shutil
 import struct as _struct
 import threading
@@ -84,24 +87,87 @@ def get_cache_directory() -> str:
     return cache_dir
 
 
+# Path separators in a cache name are flattened to "_" so every cache
+# stays a single file directly inside the cache directory.
+_SAFE_NAME_TABLE = str.maketrans({os.sep: "_", "/": "_", "\\": "_"})
+
+
+@functools.lru_cache(maxsize=256)
+def _safe_cache_name(cache_name: str) -> str:
+    return cache_name.translate(_SAFE_NAME_TABLE)
+
+
 def get_cache_file_path(cache_name: str) -> str:
     """Return the full path for a cache file (safetensors format)."""
-    safe_name = cache_name.replace(os.sep, "_").replace("/", "_").replace("\\", "_")
+    safe_name = _safe_cache_name(cache_name)
     return os.path.join(get_cache_directory(), f"{safe_name}{SAFETENSORS_EXT}")
 
 
 def get_legacy_patcher_cache_file_path(cache_name: str) -> str:
     """Return the full path for a legacy ModelPatcher cache file."""
-    safe_name = cache_name.replace(os.sep, "_").replace("/", "_").replace("\\", "_")
+    safe_name = _safe_cache_name(cache_name)
     return os.path.join(get_cache_directory(), f"{safe_name}{LEGACY_PATCHER_EXT}")
 
 
 def get_empty_marker_cache_file_path(cache_name: str) -> str:
     """Return the full path for an intentionally-empty cache marker."""
-    safe_name = cache_name.replace(os.sep, "_").replace("/", "_").replace("\\", "_")
+    safe_name = _safe_cache_name(cache_name)
     return os.path.join(get_cache_directory(), f"{safe_name}{EMPTY_MARKER_EXT}")
 
 
+def _write_atomically(path: str, write) -> None:
+    """Run ``write(tmp_path)`` and move the finished file over *path*.
+
+    ``os.replace`` is atomic on the same filesystem, so a reader (or a
+    crash mid-save) never sees a half-written cache under the real name.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+_STALE_COUNTER = itertools.count()
+
+
+def _best_effort_remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError as exc:
+        logger.debug(f"[VRAM-Cache] Deferred removal of '{path}' failed: {exc}")
+
+
+def discard_cache_file(path: str) -> None:
+    """Take *path* out of the cache namespace now and free its blocks later.
+
+    Unlinking a multi-GB file can take hundreds of milliseconds while the
+    filesystem frees its extents.  The file is first renamed to a unique
+    ``.stale`` name (a metadata-only operation) so existence probes stop
+    seeing it immediately; the actual removal runs on a daemon thread.
+    Leftovers from an interrupted removal go with the cache directory.
+    """
+    if not os.path.isfile(path):
+        return
+    doomed = f"{path}.{os.getpid()}.{next(_STALE_COUNTER)}.stale"
+    try:
+        os.replace(path, doomed)
+    except OSError as exc:
+        logger.warning(f"[VRAM-Cache] Could not remove stale cache '{path}': {exc}")
+        return
+    threading.Thread(
+        target=_best_effort_remove,
+        args=(doomed,),
+        daemon=True,
+        name="VRAMCache-StaleRemove",
+    ).start()
+
+
 # ──────────────────────────  Memory helpers  ──────────────────────────
 
 def get_free_ram_bytes() -> int:
@@ -111,10 +177,7 @@ def get_free_ram_bytes() -> int:
 
 def get_total_vram_cache_size(state_dict: Dict[str, torch.Tensor]) -> int:
     """Calculate total bytes of a state dict (on any device)."""
-    total = 0
-    for t in state_dict.values():
-        total += t.nelement() * t.element_size()
-    return total
+    return sum(t.nbytes for t in state_dict.values())
 
 
 def format_bytes(n: int) -> str:
@@ -131,6 +194,22 @@ def format_bytes(n: int) -> str:
 
 # ──────────────────────────  VRAM cleanup  ──────────────────────────
 
+def _allocator_has_cached_blocks() -> bool:
+    """Return False only when the CUDA caching allocator has nothing to release.
+
+    ``soft_empty_cache`` ends in ``torch.cuda.empty_cache``, which
+    synchronises the device and walks the allocator's free list.  When
+    reserved == allocated there are no cached blocks for it to return.
+    Other backends are always treated as having something to release.
+    """
+    try:
+        if not torch.cuda.is_available():
+            return True
+        return torch.cuda.memory_reserved() > torch.cuda.memory_allocated()
+    except Exception:
+        return True
+
+
 def cleanup_current_vram() -> None:
     """Absolutely clean up VRAM used by the current ComfyUI instance.
 
@@ -143,7 +222,8 @@ def cleanup_current_vram() -> None:
             soft_empty_cache,
         )
         unload_all_models()
-        soft_empty_cache(force=True)
+        if _allocator_has_cached_blocks():
+            soft_empty_cache(force=True)
     except ImportError:
         logger.warning("[VRAM-Cache] comfy.model_management not available; "
                        "falling back to torch.cuda.empty_cache()")
@@ -154,6 +234,21 @@ def cleanup_current_vram() -> None:
     gc.collect()
 
 
+def clear_cublas_workspaces() -> None:
+    """Free cuBLAS workspaces, which can pin hundreds of MB of VRAM.
+
+    Uses the private ``torch._C._cuda_clearCublasWorkspaces`` hook when this
+    torch build has it; a no-op otherwise.
+    """
+    clear = getattr(torch._C, "_cuda_clearCublasWorkspaces", None)
+    if clear is None or not torch.cuda.is_available():
+        return
+    try:
+        clear()
+    except Exception as exc:
+        logger.debug(f"[VRAM-Cache] Could not clear cuBLAS workspaces: {exc}")
+
+
 # ──────────────────────────  State dict capture  ──────────────────────────
 
 def capture_vram_state_dict() -> Dict[str, torch.Tensor]:
@@ -301,6 +396,56 @@ def bulk_vram_to_cpu(
         return _chunked_transfer(keys, tensors, total_bytes)
 
 
+# Every tensor starts on a multiple of this many bytes inside a concat
+# buffer, which covers the element size of every supported dtype.
+_CONCAT_ALIGN = 16
+
+
+def _concat_byte_views(
+    tensors: List[torch.Tensor],
+) -> Tuple[List[Tuple[torch.dtype, torch.Size, int]], List[torch.Tensor]]:
+    """Return ``(meta, byte_views)`` for concatenating *tensors* as raw bytes.
+
+    Each tensor's bytes are followed by zero padding up to a multiple of
+    ``_CONCAT_ALIGN``, so after the copy every slice of the CPU buffer can be
+    reinterpreted with ``view(dtype)`` in place — no per-tensor clone, and
+    peak RAM stays at one copy of the cache.
+    """
+    meta: List[Tuple[torch.dtype, torch.Size, int]] = []
+    byte_views: List[torch.Tensor] = []
+    pad_src: Optional[torch.Tensor] = None
+
+    for t in tensors:
+        td = t.detach().contiguous()
+        nbytes = td.nelement() * td.element_size()
+        # Views (e.g. tied or sliced weights) start part-way into storage
+        so = td.storage_offset() * td.element_size()
+        meta.append((td.dtype, td.shape, nbytes))
+        byte_views.append(
+            torch.as_tensor(td.untyped_storage(), dtype=torch.uint8, device=td.device)[so : so + nbytes]
+        )
+        pad = -nbytes % _CONCAT_ALIGN
+        if pad:
+            if pad_src is None or pad_src.device != td.device:
+                pad_src = torch.zeros(_CONCAT_ALIGN, dtype=torch.uint8, device=td.device)
+            byte_views.append(pad_src[:pad])
+
+    return meta, byte_views
+
+
+def _split_concat_buffer(
+    buf: torch.Tensor,
+    keys: List[str],
+    meta: List[Tuple[torch.dtype, torch.Size, int]],
+    result: Dict[str, torch.Tensor],
+) -> None:
+    """Split a buffer built from :func:`_concat_byte_views` into typed views."""
+    offset = 0
+    for key, (dtype, shape, nbytes) in zip(keys, meta):
+        result[key] = buf[offset:offset + nbytes].view(dtype).reshape(shape)
+        offset += nbytes + (-nbytes % _CONCAT_ALIGN)
+
+
 def _bulk_concat_transfer(
     keys: List[str],
     tensors: List[torch.Tensor],
@@ -328,16 +473,7 @@ def _bulk_concat_transfer(
             gpu_keys.append(key)
 
     if gpu_tensors:
-        # Record metadata for reconstruction
-        meta: List[Tuple[torch.dtype, torch.Size, int]] = []
-        byte_views: List[torch.Tensor] = []
-
-        for t in gpu_tensors:
-            td = t.detach().contiguous()
-            nbytes = td.nelement() * td.element_size()
-            meta.append((td.dtype, td.shape, nbytes))
-            bv = torch.as_tensor(td.untyped_storage(), dtype=torch.uint8, device=td.device)[:nbytes]
-            byte_views.append(bv)
+        meta, byte_views = _concat_byte_views(gpu_tensors)
 
         # One big cat on GPU → single DMA → split on CPU
         big_gpu = torch.cat(byte_views)
@@ -347,16 +483,8 @@ def _bulk_concat_transfer(
         if torch.cuda.is_available():
             torch.cuda.synchronize()
 
-        offset = 0
-        for key, (dtype, shape, nbytes) in zip(gpu_keys, meta):
-            # .clone() the byte slice so it owns its storage starting at
-            # offset 0.  Without this, mixed-dtype concat can leave the
-            # slice at a storage offset that is not divisible by the
-            # target dtype's element size (e.g. offset 6 for float32),
-            # causing "storage_offset() must be divisible by …" errors.
-            byte_slice = big_cpu[offset:offset + nbytes].clone()
-            result[key] = byte_slice.view(dtype).reshape(shape)
-            offset += nbytes
+        # Slices are aligned, so they view the buffer instead of copying it
+        _split_concat_buffer(big_cpu, gpu_keys, meta, result)
         del big_cpu
 
     elapsed = time.perf_counter() - t0
@@ -399,25 +527,14 @@ def _chunked_transfer(
 
         if gpu_chunk_tensors:
             # Build byte views for GPU tensors only
-            meta: List[Tuple[torch.dtype, torch.Size, int]] = []
-            byte_views: List[torch.Tensor] = []
-            for t in gpu_chunk_tensors:
-                td = t.detach().contiguous()
-                nb = td.nelement() * td.element_size()
-                meta.append((td.dtype, td.shape, nb))
-                bv = torch.as_tensor(td.untyped_storage(), dtype=torch.uint8, device=td.device)[:nb]
-                byte_views.append(bv)
+            meta, byte_views = _concat_byte_views(gpu_chunk_tensors)
 
             cat_gpu = torch.cat(byte_views)
             del byte_views
             cat_cpu = cat_gpu.cpu()
             del cat_gpu
 
-            offset = 0
-            for ck, (dtype, shape, nb) in zip(gpu_chunk_keys, meta):
-                byte_slice = cat_cpu[offset:offset + nb]
-                result[ck] = byte_slice.view(dtype).reshape(shape).clone()
-                offset += nb
+            _split_concat_buffer(cat_cpu, gpu_chunk_keys, meta, result)
             del cat_cpu
 
         chunk_keys.clear()
@@ -459,6 +576,8 @@ class _RAMCacheEntry:
 
     def __init__(self, cpu_state_dict: Dict[str, torch.Tensor]):
         self.state_dict: Dict[str, torch.Tensor] = cpu_state_dict
+        # Sized once here; the dict is read-only for the entry's lifetime.
+        self.total_bytes: int = get_total_vram_cache_size(cpu_state_dict)
         self._lock = threading.Lock()
 
         # Single mmap guard for the whole entry
@@ -479,6 +598,7 @@ class _RAMCacheEntry:
         with self._lock:
             _safe_close(self._mmap_guard)
             self.state_dict.clear()
+            self.total_bytes = 0
 
 
 def _safe_close(mm):
@@ -515,9 +635,9 @@ class RAMCacheManager:
                 self._caches[name].release()
             entry = _RAMCacheEntry(cpu_state_dict)
             self._caches[name] = entry
-            size = get_total_vram_cache_size(entry.state_dict)
             logger.info(f"[VRAM-Cache] RAM cache '{name}' stored – "
-                        f"{len(entry.state_dict)} tensors, {format_bytes(size)}.")
+                        f"{len(entry.state_dict)} tensors, "
+                        f"{format_bytes(entry.total_bytes)}.")
 
     def load(self, name: str) -> Dict[str, torch.Tensor]:
         """Return the read-only state dict for *name* (raises KeyError if absent)."""
@@ -526,20 +646,34 @@ class RAMCacheManager:
                 raise KeyError(f"RAM cache '{name}' not found.")
             return self._caches[name].get_state_dict()
 
+    def size(self, name: str) -> int:
+        """Return the byte size recorded when *name* was stored (raises KeyError if absent)."""
+        with self._lock:
+            if name not in self._caches:
+                raise KeyError(f"RAM cache '{name}' not found.")
+            return self._caches[name].total_bytes
+
     def exists(self, name: str) -> bool:
         with self._lock:
             return name in self._caches
 
-    def clear_all(self) -> int:
-        """Release every RAM cache. Returns the number of entries cleared."""
+    def clear_all(self, collect: bool = True) -> int:
+        """Release every RAM cache. Returns the number of entries cleared.
+
+        Pass ``collect=False`` when the caller runs a single ``gc.collect()``
+        itself after clearing several managers.
+        """
         with self._lock:
-            count = len(self._caches)
-            for entry in self._caches.values():
-                entry.release()
+            entries = list(self._caches.values())
             self._caches.clear()
+        for entry in entries:
+            entry.release()
+        count = len(entries)
+        del entries
+        if collect:
             gc.collect()
-            logger.info(f"[VRAM-Cache] Cleared {count} RAM cache(s).")
-            return count
+        logger.info(f"[VRAM-Cache] Cleared {count} RAM cache(s).")
+        return count
 
     def release(self, name: str) -> None:
         """Release a single named RAM cache entry and remove it from the registry."""
@@ -592,11 +726,12 @@ class LegacyPatcherCacheManager:
         with self._lock:
             return name in self._caches
 
-    def clear_all(self) -> int:
+    def clear_all(self, collect: bool = True) -> int:
         with self._lock:
             count = len(self._caches)
             self._caches.clear()
-        gc.collect()
+        if collect:
+            gc.collect()
         logger.info(f"[VRAM-Cache] Cleared {count} legacy RAM cache(s).")
         return count
 
@@ -650,7 +785,12 @@ def save_legacy_patchers_to_disk(
         )
 
     t0 = time.perf_counter()
-    torch.save(save_data, path)
+    # Tensor storages go into the zip archive as raw records either way;
+    # the newest pickle protocol (framing, compact opcodes) only speeds up
+    # walking the nn.Module object graph around them.
+    _write_atomically(path, lambda tmp_path: torch.save(
+        save_data, tmp_path, pickle_protocol=pickle.HIGHEST_PROTOCOL,
+    ))
     elapsed = time.perf_counter() - t0
     file_size = os.path.getsize(path)
 
@@ -664,6 +804,22 @@ def save_legacy_patchers_to_disk(
     return path, elapsed, file_size
 
 
+def _torch_load_legacy(path: str) -> Any:
+    """``torch.load`` a legacy cache, memory-mapping its storages when possible.
+
+    With ``mmap=True`` tensors reference file-backed pages instead of being
+    read into a fresh anonymous allocation first, so loading does not need
+    a second copy of the cache in RAM.  Not used on Windows, where a mapped
+    file cannot be replaced or removed by the next save of the same name.
+    """
+    if os.name != "nt":
+        try:
+            return torch.load(path, weights_only=False, mmap=True)
+        except TypeError:
+            pass  # torch < 2.1 has no mmap argument
+    return torch.load(path, weights_only=False)
+
+
 def load_legacy_patchers_from_disk(cache_name: str) -> Optional[List[Any]]:
     """Load legacy ModelPatcher objects from a .pt cache file."""
     with _LEGACY_DISK_LOCK:
@@ -683,7 +839,7 @@ def load_legacy_patchers_from_disk(cache_name: str) -> Optional[List[Any]]:
         ) from exc
 
     t0 = time.perf_counter()
-    save_data = torch.load(path, weights_only=False)
+    save_data = _torch_load_legacy(path)
     patchers: List[Any] = []
     for item in save_data:
         patchers.append(
@@ -826,11 +982,82 @@ def release_empty_cache_marker(cache_name: str, remove_disk: bool = False) -> No
 # ──────────────────────────  Disk I/O  ──────────────────────────
 
 
+def _cpu_byte_view(t: torch.Tensor):
+    """Zero-copy uint8 numpy view of a contiguous CPU tensor's data."""
+    nbytes = t.nelement() * t.element_size()
+    if nbytes == 0:
+        return b""
+    # Account for possible storage offset (views / slices)
+    so = t.storage_offset() * t.element_size()
+    raw = torch.as_tensor(t.untyped_storage(), dtype=torch.uint8)[so : so + nbytes]
+    return raw.numpy()
+
+
+def _iter_cpu_tensors(
+    state_dict: Dict[str, torch.Tensor],
+    keys: List[str],
+):
+    """Yield ``(key, cpu_tensor)`` pairs, overlapping D2H copies with the consumer.
+
+    CUDA tensors are copied into one of two reusable pinned staging buffers
+    with ``non_blocking=True``.  The copy for the next tensor is issued
+    before the current one is handed out, so the DMA runs while the caller
+    writes the previous tensor to disk.  Tensors yielded from a staging
+    buffer are only valid until the next iteration.
+    """
+    cuda_sizes = [
+        t.nelement() * t.element_size()
+        for t in state_dict.values()
+        if t.device.type == "cuda"
+    ]
+    staging: List[torch.Tensor] = []
+    if cuda_sizes:
+        try:
+            cap = max(cuda_sizes)
+            staging = [
+                torch.empty(cap, dtype=torch.uint8, pin_memory=True)
+                for _ in range(2)
+            ]
+        except RuntimeError as exc:
+            logger.debug(f"[VRAM-Cache] Pinned staging unavailable ({exc}); copying synchronously.")
+            staging = []
+
+    def _issue(i: int):
+        t = state_dict[keys[i]].detach()
+        if staging and t.device.type == "cuda":
+            if not t.is_contiguous():
+                t = t.contiguous()
+            nbytes = t.nelement() * t.element_size()
+            dst = staging[i % 2][:nbytes].view(t.dtype).view(t.shape)
+            dst.copy_(t, non_blocking=True)
+            event = torch.cuda.Event()
+            event.record(torch.cuda.current_stream(t.device))
+            return dst, event
+        if t.device.type != "cpu":
+            t = t.cpu()
+        if not t.is_contiguous():
+            t = t.contiguous()
+        return t, None
+
+    if not keys:
+        return
+    pending = _issue(0)
+    for i, key in enumerate(keys):
+        current, event = pending
+        if i + 1 < len(keys):
+            # Buffer (i + 1) % 2 was last used by tensor i - 1, which the
+            # consumer has finished with by the time we are resumed.
+            pending = _issue(i + 1)
+        if event is not None:
+            event.synchronize()
+        yield key, current
+
+
 def _write_safetensors(
-    cpu_state_dict: Dict[str, torch.Tensor],
+    state_dict: Dict[str, torch.Tensor],
     path: str,
 ) -> None:
-    """Write *cpu_state_dict* in safetensors binary format using Python I/O.
+    """Write *state_dict* in safetensors binary format using Python I/O.
 
     Unlike ``safetensors.torch.save_file`` (a Rust/PyO3 C extension), every
     ``file.write()`` call here goes through Python's ``io.BufferedWriter``
@@ -841,17 +1068,23 @@ def _write_safetensors(
     parallel, instead of being blocked by GIL contention for the entire
     duration of the write.
 
+    Tensors may live on any device.  The header only needs dtypes and
+    shapes, so each tensor is brought to CPU just before its bytes are
+    written and dropped right after — a VRAM-resident state dict (the Disk
+    Only branch) streams through RAM one tensor at a time instead of being
+    staged whole, and the copy of the next tensor overlaps the write of the
+    current one (see :func:`_iter_cpu_tensors`).
+
     The output is 100 % compatible with ``safetensors.torch.load_file``.
     """
-    ordered_keys = sorted(cpu_state_dict.keys())
+    ordered_keys = sorted(state_dict.keys())
 
-    # ── Build header and collect zero-copy numpy views ──────────
+    # ── Build header from metadata only (no data access) ────────
     header: Dict[str, Any] = {}
-    data_views: list = []
     offset = 0
 
     for key in ordered_keys:
-        t = cpu_state_dict[key]
+        t = state_dict[key]
         nbytes = t.nelement() * t.element_size()
         dt = _TORCH_TO_ST_DTYPE.get(t.dtype)
         if dt is None:
@@ -863,15 +1096,6 @@ def _write_safetensors(
             "shape": list(t.shape),
             "data_offsets": [offset, offset + nbytes],
         }
-        if nbytes > 0:
-            # Account for possible storage offset (views / slices)
-            so = t.storage_offset() * t.element_size()
-            raw = torch.as_tensor(
-                t.untyped_storage(), dtype=torch.uint8
-            )[so : so + nbytes]
-            data_views.append(raw.numpy())       # zero-copy view
-        else:
-            data_views.append(b"")
         offset += nbytes
 
     # ── Serialise header JSON (space-padded to 8-byte boundary) ─
@@ -884,8 +1108,8 @@ def _write_safetensors(
     with open(path, "wb", buffering=8 * 1024 * 1024) as f:
         f.write(_struct.pack("<Q", len(header_bytes)))
         f.write(header_bytes)
-        for view in data_views:
-            f.write(view)
+        for _key, t in _iter_cpu_tensors(state_dict, ordered_keys):
+            f.write(_cpu_byte_view(t))
 
 
 def save_state_dict_to_disk(
@@ -894,25 +1118,17 @@ def save_state_dict_to_disk(
 ) -> Tuple[str, float, int]:
     """Save *state_dict* to disk using safetensors (fastest, no pickle).
 
-    All tensors are detached and moved to CPU contiguously before saving.
+    Tensors may be on CPU or GPU; see :func:`_write_safetensors` for how
+    GPU tensors are streamed.
     Returns ``(file_path, elapsed_seconds, bytes_written)``.
 
     Safetensors writes raw tensor data with minimal framing – close to
     the theoretical memcpy speed.
     """
     path = get_cache_file_path(cache_name)
-    # safetensors requires all tensors on CPU & contiguous
-    cpu_dict: Dict[str, torch.Tensor] = {}
-    for k, v in state_dict.items():
-        t = v.detach()
-        if t.device.type != "cpu":
-            t = t.cpu()
-        if not t.is_contiguous():
-            t = t.contiguous()
-        cpu_dict[k] = t
 
     t0 = time.perf_counter()
-    _write_safetensors(cpu_dict, path)
+    _write_atomically(path, lambda tmp_path: _write_safetensors(state_dict, tmp_path))
     elapsed = time.perf_counter() - t0
     file_size = os.path.getsize(path)
 
@@ -956,6 +1172,10 @@ def disk_cache_exists(cache_name: str) -> bool:
 
 # ──────────────────────────  Monitor subprocess (thread)  ──────────────────────────
 
+# Slice length for unbounded waits on a monitor (keeps them interruptible).
+_WAIT_POLL_SECONDS = 0.5
+
+
 class _ToDiskMonitor(threading.Thread):
     """Background thread that saves a state_dict to disk.
 
@@ -1008,8 +1228,16 @@ class _ToDiskMonitor(threading.Thread):
             self.done_event.set()
 
     def wait(self, timeout: Optional[float] = None) -> bool:
-        """Block until saving is done.  Returns True if completed."""
-        return self.done_event.wait(timeout=timeout)
+        """Block until saving is done.  Returns True if completed.
+
+        An unbounded wait is done as a loop of short timed waits: a single
+        untimed ``Event.wait`` cannot be interrupted by Ctrl-C on Windows.
+        """
+        if timeout is not None:
+            return self.done_event.wait(timeout=timeout)
+        while not self.done_event.wait(timeout=_WAIT_POLL_SECONDS):
+            pass
+        return True
 
 
 class ToDiskMonitorManager:
@@ -1029,16 +1257,21 @@ class ToDiskMonitorManager:
     def start_monitor(
         self, cache_name: str, state_dict: Dict[str, torch.Tensor]
     ) -> _ToDiskMonitor:
-        """Start (or replace) a background disk-save thread for *cache_name*."""
-        with self._lock:
-            # If there's already a monitor with this name, wait for it first
-            existing = self._monitors.get(cache_name)
-            if existing is not None and existing.is_alive():
-                existing.wait()
-            monitor = _ToDiskMonitor(cache_name, state_dict)
-            self._monitors[cache_name] = monitor
-            monitor.start()
-            return monitor
+        """Start (or replace) a background disk-save thread for *cache_name*.
+
+        An in-flight save for the same name is waited on *outside* the
+        registry lock, so saves and probes for other names are never held
+        up by it; the check is repeated in case another caller got in first.
+        """
+        while True:
+            with self._lock:
+                existing = self._monitors.get(cache_name)
+                if existing is None or existing.done_event.is_set():
+                    monitor = _ToDiskMonitor(cache_name, state_dict)
+                    self._monitors[cache_name] = monitor
+                    monitor.start()
+                    return monitor
+            existing.wait()
 
     def get_monitor(self, cache_name: str) -> Optional[_ToDiskMonitor]:
         with self._lock:
@@ -1083,6 +1316,26 @@ def disk_monitors() -> ToDiskMonitorManager:
 
 # ──────────────────────────  Startup / shutdown lifecycle  ──────────────────────────
 
+# A cache directory renamed to ``<cache_dir>.doomed.<pid>.<n>`` is
+# pending deletion; renaming is O(1) where ``rmtree`` unlinks file by file.
+_DOOMED_MARKER = ".doomed."
+
+
+def _doom_directory(path: str) -> Optional[str]:
+    """Rename *path* to a unique doomed sibling; return it, or None on failure."""
+    doomed = f"{path}{_DOOMED_MARKER}{os.getpid()}.{next(_STALE_COUNTER)}"
+    try:
+        os.rename(path, doomed)
+    except OSError:
+        return None
+    return doomed
+
+
+def _remove_directories(paths: List[str]) -> None:
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+
+
 def _startup_cleanup() -> None:
     """Wipe the disk cache directory clean at startup.
 
@@ -1091,25 +1344,48 @@ def _startup_cleanup() -> None:
     safety net for non-standard launches or in-process restarts where
     the temp directory was not wiped first.
 
+    A leftover cache directory is renamed out of the way and deleted —
+    together with any doomed directories left by earlier shutdowns — on
+    a daemon thread, so a large stale cache does not delay startup.
+
     Uses ``_cache_directory_path()`` (not ``get_cache_directory()``) so
     that the folder is not immediately recreated by the makedirs inside
     that function.
     """
     try:
         cache_dir = _cache_directory_path()
-        if os.path.isdir(cache_dir):
+        if os.path.isdir(cache_dir) and _doom_directory(cache_dir) is None:
             shutil.rmtree(cache_dir, ignore_errors=True)
+
+        parent = os.path.dirname(cache_dir)
+        prefix = os.path.basename(cache_dir) + _DOOMED_MARKER
+        doomed = [
+            os.path.join(parent, name)
+            for name in os.listdir(parent)
+            if name.startswith(prefix)
+        ] if os.path.isdir(parent) else []
+        if doomed:
+            threading.Thread(
+                target=_remove_directories,
+                args=(doomed,),
+                daemon=True,
+                name="VRAMCache-StartupCleanup",
+            ).start()
     except Exception:
         pass
 
 
 def _shutdown_cleanup() -> None:
-    """atexit handler: wait for active disk saves, free RAM caches, delete cache dir.
+    """atexit handler: wait for active disk saves, free RAM caches, retire cache dir.
 
     This runs before ComfyUI's own ``cleanup_temp()`` so that any still-running
     background disk-save threads have a chance to finish (and release their file
-    handles) before the directory is deleted.  Without this wait, ``shutil.rmtree``
-    could race with an active write and leave a corrupt or partially-deleted tree.
+    handles) before the directory is retired.  Without this wait, the rename
+    (or ``shutil.rmtree`` fallback) could race with an active write.
+
+    The directory is only renamed to a doomed sibling here; deleting a
+    multi-GB cache file by file can outlast what atexit tolerates.  ComfyUI's
+    temp cleanup or the next startup removes it.
 
     Uses ``_cache_directory_path()`` (not ``get_cache_directory()``) so
     that the folder is not immediately recreated by the makedirs inside
@@ -1136,7 +1412,7 @@ def _shutdown_cleanup() -> None:
         pass
     try:
         cache_dir = _cache_directory_path()
-        if os.path.isdir(cache_dir):
+        if os.path.isdir(cache_dir) and _doom_directory(cache_dir) is None:
             shutil.rmtree(cache_dir, ignore_errors=True)
     except Exception:
         pass
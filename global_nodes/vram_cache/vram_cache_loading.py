@@ -15,7 +15,7 @@ import json
 import logging
 import os
 import time
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import torch
 
@@ -27,7 +27,6 @@ from .utils import (
     empty_cache_markers,
     empty_disk_marker_names,
     format_bytes,
-    get_total_vram_cache_size,
     legacy_patcher_cache,
     legacy_patcher_disk_cache_exists,
     legacy_patcher_disk_cache_names,
@@ -182,14 +181,10 @@ class SimpleGlobalVRAMCacheLoading:
         t_start = time.perf_counter()
 
         # Step 1 – detect source ───────────────────────────────
-        has_ram = ram_cache().exists(cache_name)
-        has_disk = disk_cache_exists(cache_name)
-        has_legacy_ram = legacy_patcher_cache().exists(cache_name)
-        has_legacy_disk = legacy_patcher_disk_cache_exists(cache_name)
-        has_empty_marker = empty_cache_marker_exists(cache_name)
-
-        if not (has_ram or has_disk or has_legacy_ram or has_legacy_disk):
-            if has_empty_marker:
+        source = self._detect_source(cache_name)
+
+        if source is None:
+            if empty_cache_marker_exists(cache_name):
                 logger.info(
                     f"[VRAM-Cache-Load] Empty cache marker found for "
                     f"'{cache_name}'. Passing through without VRAM changes."
@@ -210,15 +205,15 @@ class SimpleGlobalVRAMCacheLoading:
         # Step 2 – clean VRAM before restoring a non-empty cache ─
         cleanup_current_vram()
 
-        if has_ram:
+        if source == "ram":
             state = self._load_from_ram(cache_name)
-        elif has_disk:
+        elif source == "disk":
             state = self._load_from_disk(cache_name)
-        elif has_legacy_ram:
+        elif source == "legacy_ram":
             patchers = self._load_legacy_from_ram(cache_name)
             _restore_legacy_patchers_to_vram(patchers, "RAM", cache_name)
             return (anything,)
-        elif has_legacy_disk:
+        else:
             patchers = self._load_legacy_from_disk(cache_name)
             _restore_legacy_patchers_to_vram(patchers, "disk", cache_name)
             return (anything,)
@@ -227,13 +222,32 @@ class SimpleGlobalVRAMCacheLoading:
         _restore_models_to_vram(state)
         return (anything,)
 
+    # ── Source detection ──────────────────────────────────────
+    @staticmethod
+    def _detect_source(cache_name: str) -> Optional[str]:
+        """Return the highest-priority cache source for *cache_name*, or None.
+
+        Probes run in priority order and stop at the first hit, so the
+        common RAM hit costs one registry lookup instead of every manager's
+        lock plus three filesystem stats.
+        """
+        if ram_cache().exists(cache_name):
+            return "ram"
+        if disk_cache_exists(cache_name):
+            return "disk"
+        if legacy_patcher_cache().exists(cache_name):
+            return "legacy_ram"
+        if legacy_patcher_disk_cache_exists(cache_name):
+            return "legacy_disk"
+        return None
+
     # ── Load from RAM (zero-copy read-only) ───────────────────
     def _load_from_ram(self, cache_name: str) -> Dict[str, torch.Tensor]:
         t0 = time.perf_counter()
 
         # ram_cache().load returns the READ-ONLY dict by reference – no copy
         state = ram_cache().load(cache_name)
-        size = get_total_vram_cache_size(state)
+        size = ram_cache().size(cache_name)
 
         elapsed = time.perf_counter() - t0
         logger.info(
@@ -244,9 +258,10 @@ class SimpleGlobalVRAMCacheLoading:
 
     # ── Load from Disk ────────────────────────────────────────
     def _load_from_disk(self, cache_name: str) -> Dict[str, torch.Tensor]:
-        # Wait for any active disk monitor with the same name
+        # Wait for any disk monitor with the same name; a failed save must
+        # not fall through to whatever older file is still on disk.
         monitor = disk_monitors().get_monitor(cache_name)
-        if monitor is not None and monitor.is_alive():
+        if monitor is not None:
             monitor.wait()
             if monitor.error:
                 raise RuntimeError(
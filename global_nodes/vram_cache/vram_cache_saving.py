@@ -8,8 +8,8 @@ Algorithm overview
    • RAM + Disk branch  (free RAM ≥ cache size):
        a. Bulk-transfer tensors GPU -> CPU in a single DMA (bulk_vram_to_cpu).
        b. Store CPU tensors in the RAM cache (mmap-guarded).
-       c. Clean VRAM completely.
-       d. Kick off a background thread that writes RAM cache → disk.
+       c. Kick off a background thread that writes RAM cache → disk.
+       d. Clean VRAM completely (overlapping the disk write).
        e. Node finishes **immediately** — disk I/O continues in background.
    • Disk Only branch  (free RAM < cache size):
        a. Kick off a background thread that reads VRAM tensors → disk.
@@ -34,6 +34,7 @@ from .utils import (
     capture_legacy_model_patchers,
     capture_vram_state_dict,
     cleanup_current_vram,
+    discard_cache_file,
     disk_monitors,
     format_bytes,
     get_cache_file_path,
@@ -198,14 +199,17 @@ class SimpleGlobalVRAMCacheSaving:
         # Drop refs to the original VRAM tensors before cleanup
         del state_dict
 
-        # Step d – Clean VRAM
-        cleanup_current_vram()
-
-        # Step e – Kick off background disk save (truly non-blocking).
+        # Step d – Kick off background disk save (truly non-blocking).
         # We pass the RAM cache dict by reference — the background thread
-        # only reads it and never mutates it, so no data race.
+        # only reads it and never mutates it, so no data race.  Starting it
+        # before the VRAM cleanup lets the write overlap the unload.
         ram_state = ram_cache().load(cache_name)
         disk_monitors().start_monitor(cache_name, ram_state)
+
+        # Step e – Clean VRAM.  This stays on the calling thread: ComfyUI's
+        # model_management is not thread-safe, and downstream nodes expect
+        # VRAM to be free when this node returns.
+        cleanup_current_vram()
         # *** Node returns here — no waiting on disk I/O ***
 
     # ── Disk Only branch ──────────────────────────────────────
@@ -258,15 +262,7 @@ class SimpleGlobalVRAMCacheSaving:
             disk_monitors().wait_for(cache_name)
             ram_cache().release(cache_name)
             gc.collect()
-        tensor_disk_path = get_cache_file_path(cache_name)
-        if os.path.isfile(tensor_disk_path):
-            try:
-                os.remove(tensor_disk_path)
-            except OSError as exc:
-                logger.warning(
-                    f"[VRAM-Cache-Save] Could not remove stale tensor disk "
-                    f"cache '{tensor_disk_path}': {exc}"
-                )
+        discard_cache_file(get_cache_file_path(cache_name))
         release_empty_cache_marker(cache_name, remove_disk=True)
 
         legacy_patcher_cache().store(cache_name, patchers)
@@ -282,6 +278,10 @@ class SimpleGlobalVRAMCacheSaving:
                 f"to {path} ({format_bytes(file_size)} in {elapsed:.2f}s, "
                 f"mode={cache_mode})."
             )
+            if cache_mode == "Only to Disk":
+                # The user asked not to keep this cache in RAM; the disk copy
+                # is reloaded memory-mapped, so RSS stays bounded.
+                legacy_patcher_cache().release(cache_name)
         except Exception as exc:
             logger.warning(
                 f"[VRAM-Cache-Save] Legacy disk save failed for '{cache_name}', "
@@ -297,18 +297,8 @@ class SimpleGlobalVRAMCacheSaving:
         if legacy_patcher_cache().exists(cache_name):
             legacy_patcher_cache().release(cache_name)
 
-        for path in (
-            get_cache_file_path(cache_name),
-            get_legacy_patcher_cache_file_path(cache_name),
-        ):
-            if os.path.isfile(path):
-                try:
-                    os.remove(path)
-                except OSError as exc:
-                    logger.warning(
-                        f"[VRAM-Cache-Save] Could not remove stale cache "
-                        f"'{path}': {exc}"
-                    )
+        discard_cache_file(get_cache_file_path(cache_name))
+        discard_cache_file(get_legacy_patcher_cache_file_path(cache_name))
 
         marker_path = store_empty_cache_marker(cache_name)
         logger.info(
@@ -5,13 +5,16 @@ Algorithm
 1. Wait for ALL active to-disk monitor threads to finish.
 2. Release every RAM cache entry created by VRAM Cache Saving.
    (Disk caches are NOT touched and remain available.)
+3. Run a single GC pass and free cuBLAS workspaces.
 """
 
+import gc
 import logging
 import time
 from typing import Any, Tuple
 
 from .utils import (
+    clear_cublas_workspaces,
     disk_monitors,
     empty_cache_markers,
     format_bytes,
@@ -61,27 +64,38 @@ class SimpleGlobalVRAMCacheRAMClearing:
             disk_monitors().wait_for_all()
 
         # Step 2 – clear all RAM caches ────────────────────────
-        names = ram_cache().names()
-        if names:
-            logger.info(
-                f"[VRAM-Cache-RAMClear] Clearing {len(names)} RAM cache(s): "
-                f"{names}"
-            )
-        count = ram_cache().clear_all()
-        legacy_names = legacy_patcher_cache().names()
-        if legacy_names:
-            logger.info(
-                f"[VRAM-Cache-RAMClear] Clearing {len(legacy_names)} "
-                f"legacy RAM cache(s): {legacy_names}"
-            )
-        legacy_count = legacy_patcher_cache().clear_all()
-        empty_names = empty_cache_markers().names()
-        if empty_names:
-            logger.info(
-                f"[VRAM-Cache-RAMClear] Clearing {len(empty_names)} "
-                f"empty RAM marker(s): {empty_names}"
-            )
-        empty_count = empty_cache_markers().clear_all()
+        # Automatic GC is held off while the references drop so it does
+        # not repeatedly scan a half-torn-down object graph; one full
+        # collection runs once everything is released.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            names = ram_cache().names()
+            if names:
+                logger.info(
+                    f"[VRAM-Cache-RAMClear] Clearing {len(names)} RAM cache(s): "
+                    f"{names}"
+                )
+            count = ram_cache().clear_all(collect=False)
+            legacy_names = legacy_patcher_cache().names()
+            if legacy_names:
+                logger.info(
+                    f"[VRAM-Cache-RAMClear] Clearing {len(legacy_names)} "
+                    f"legacy RAM cache(s): {legacy_names}"
+                )
+            legacy_count = legacy_patcher_cache().clear_all(collect=False)
+            empty_names = empty_cache_markers().names()
+            if empty_names:
+                logger.info(
+                    f"[VRAM-Cache-RAMClear] Clearing {len(empty_names)} "
+                    f"empty RAM marker(s): {empty_names}"
+                )
+            empty_count = empty_cache_markers().clear_all()
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        gc.collect()
+        clear_cublas_workspaces()
 
         elapsed = time.perf_counter() - t_start
         logger.info(